@@ -0,0 +1,57 @@
+"""Time stable ids and deck diffs as the deck grows.
+
+Usage: python benchmarks/deck_diff.py [--rows N ...] [--edits FRACTION]
+
+Each synthetic deck is built tagged, given ids, then edited: a share of
+its records get a new meaning, as many are dropped and as many new ones
+appended. The per-record time of diff_decks() should stay flat as the
+deck grows; the patch is applied back to check it reproduces the edit.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from synthetic import synthetic_topics  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[50000, 100000, 250000, 500000],
+                        help='synthetic deck sizes')
+    parser.add_argument('--edits', type=float, default=0.01,
+                        help='share of records changed, removed and added (each)')
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        records = list(builder.iter_vocabulary_items(synthetic_topics(rows), tagged=True))
+        started = time.perf_counter()
+        old = list(builder.with_ids(records))
+        id_seconds = time.perf_counter() - started
+
+        step = max(1, int(1 / args.edits)) if args.edits else len(old) + 1
+        new = []
+        for position, item in enumerate(old):
+            if position % step == 1:
+                continue
+            if position % step == 0:
+                item = dict(item, meaning=item["meaning"] + " (sửa)")
+            new.append(item)
+        extra = [dict(item, word="new " + item["word"]) for item in records[::step]]
+        new.extend(builder.with_ids(extra))
+
+        started = time.perf_counter()
+        patch = builder.diff_decks(old, new)
+        diff_seconds = time.perf_counter() - started
+        applied = builder.apply_patch(old, patch)
+        assert {item["id"]: item for item in applied} == {item["id"]: item for item in new}
+        print(f"{rows:>8,} rows  ids {id_seconds:6.2f} s  diff {diff_seconds:6.2f} s "
+              f"({diff_seconds / rows * 1e6:5.2f} us/row)  {len(patch['added']):,} added  "
+              f"{len(patch['changed']):,} changed  {len(patch['removed']):,} removed")
+
+
+if __name__ == '__main__':
+    main()
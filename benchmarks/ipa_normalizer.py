@@ -0,0 +1,65 @@
+"""Measure IPA normalization throughput on OCR-style word lists.
+
+Usage: python benchmarks/ipa_normalizer.py [--rows N] [--repeat R]
+
+The list repeats the TOEIC deck's pronunciations, many of them damaged,
+with a share of them given extra confusable glyphs so that not every line
+is a repeat, the way pages scanned from several books overlap. The
+memoized stage is compared with calling normalize_ipa() on every line.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+
+# Confusables swapped into the synthetic lines, as (IPA, OCR glyph)
+DAMAGE = (('ɪ', 'ı'), ('ə', 'ǝ'), ('ʃ', 'ſ'), ('r', 'Γ'), ('p', 'р'), ('e', 'ε'), ('ː', ':'))
+
+
+def ocr_lines(rows, seed=0):
+    rng = random.Random(seed)
+    records = list(builder.build_deck())
+    lines = []
+    for index in range(rows):
+        record = records[index % len(records)]
+        pronounce = record["pronounce"]
+        if rng.random() < 0.3:
+            clean, damaged = rng.choice(DAMAGE)
+            pronounce = pronounce.replace(damaged, clean).replace(clean, damaged, 1) + ' ' * rng.randrange(3)
+        lines.append({"word": record["word"], "pronounce": pronounce, "meaning": record["meaning"]})
+    return lines
+
+
+def best_of(repeat, func):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    lines = ocr_lines(args.rows)
+    _records, report = builder.normalize_pronunciations([dict(line) for line in lines])
+    print(f"{args.rows:,} lines, {report['strings']:,} distinct pronunciations, "
+          f"{report['repaired']:,} repaired, {len(report['flagged']):,} flagged")
+
+    every_line = best_of(args.repeat, lambda: [builder.normalize_ipa(line["pronounce"]) for line in lines])
+    memoized = best_of(args.repeat, lambda: builder.normalize_pronunciations([dict(line) for line in lines]))
+    for label, elapsed in (('normalize_ipa per line', every_line), ('memoized stage', memoized)):
+        print(f"  {label:<24} {elapsed:8.3f} s  {args.rows / elapsed / 1e3:8.1f} k lines/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Compare answering single-word queries from the JSON deck and from the mmap lookup file.
+
+Usage: python benchmarks/lookup_file.py [--rows N] [--queries Q]
+
+A synthetic deck of N rows is written both as the build's JSON array and
+as a lookup file. Startup is the time from nothing to the first answer:
+json.load plus building a word index for JSON, opening the file for the
+lookup file. Lookups are Q random headwords answered with their meaning.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from synthetic import synthetic_topics  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000, help='rows in the synthetic deck')
+    parser.add_argument('--queries', type=int, default=100000, help='random headword lookups to time')
+    args = parser.parse_args()
+
+    records = list(builder.iter_vocabulary_items(synthetic_topics(args.rows)))
+    queries = [record["word"] for record in random.Random(0).choices(records, k=args.queries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'deck.json')
+        lookup_path = os.path.join(tmp, 'deck.lookup.bin')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            builder.write_json_array(records, f)
+        started = time.perf_counter()
+        builder.write_lookup(lookup_path, records)
+        write_seconds = time.perf_counter() - started
+        del records
+
+        started = time.perf_counter()
+        with open(json_path, encoding='utf-8') as f:
+            index = {}
+            for record in json.load(f):
+                index.setdefault(record["word"], []).append(record)
+        json_startup = time.perf_counter() - started
+        started = time.perf_counter()
+        for word in queries:
+            index[word][0]["meaning"]
+        json_lookups = time.perf_counter() - started
+        del index
+
+        started = time.perf_counter()
+        lookup = builder.LookupFile(lookup_path)
+        lookup_startup = time.perf_counter() - started
+        started = time.perf_counter()
+        for word in queries:
+            lookup.get(word)[0].meaning
+        lookup_seconds = time.perf_counter() - started
+        lookup.close()
+
+        print(f"{args.rows:,} rows: JSON {os.path.getsize(json_path):,} B, "
+              f"lookup file {os.path.getsize(lookup_path):,} B (written in {write_seconds:.2f} s)")
+        for name, startup, seconds in (('JSON + dict', json_startup, json_lookups),
+                                       ('lookup file', lookup_startup, lookup_seconds)):
+            print(f"  {name:<12} startup {startup * 1000:10.3f} ms  "
+                  f"{seconds / args.queries * 1e6:6.2f} us/lookup")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark the build pipeline stage by stage on synthetic decks.
+
+Usage: python benchmarks/pipeline.py [--sizes 600 60000 600000] [--repeat R]
+                                     [--output FILE] [--compare OLD_FILE]
+
+For every deck size this measures POS stripping (parse_pos_batch over each
+topic), record assembly (iter_topic_records over each topic, which runs its
+own POS pass, so assembly alone is the difference of the two), JSON
+serialization (write_json_array to a temporary file) and the whole
+pipeline end to end. Wall time is the best of --repeat runs without
+tracing; peak memory comes from a separate run under tracemalloc and only
+counts what the stage itself allocates. Results are written as JSON so
+runs from different commits can be compared with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from synthetic import synthetic_topics  # noqa: E402
+
+
+def stage_pos(topics):
+    return [builder.parse_pos_batch(words)[0] for _n, _name, words, _p, _m in topics]
+
+
+def stage_assemble(topics):
+    return [record for _n, _name, words, pronounces, meanings in topics
+            for record in builder.iter_topic_records(words, pronounces, meanings)]
+
+
+def stage_serialize(records, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        builder.write_json_array(records, f)
+    return os.path.getsize(path)
+
+
+def stage_end_to_end(topics, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        builder.write_json_array(builder.iter_vocabulary_items(topics), f)
+    return os.path.getsize(path)
+
+
+def measure(func, repeat):
+    """Return (best wall seconds, traced peak bytes, result of the last call)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+        del result
+    tracemalloc.start()
+    try:
+        result = func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+
+def run_size(rows, repeat, path):
+    topics = synthetic_topics(rows, untagged_every=97)
+    results = {}
+
+    seconds, peak, _cleaned = measure(lambda: stage_pos(topics), repeat)
+    results["pos"] = {"seconds": seconds, "peakBytes": peak, "outputBytes": None}
+
+    seconds, peak, records = measure(lambda: stage_assemble(topics), repeat)
+    results["assemble"] = {"seconds": seconds, "peakBytes": peak, "outputBytes": None}
+
+    seconds, peak, size = measure(lambda: stage_serialize(records, path), repeat)
+    results["serialize"] = {"seconds": seconds, "peakBytes": peak, "outputBytes": size}
+    del records
+
+    seconds, peak, size = measure(lambda: stage_end_to_end(topics, path), repeat)
+    results["endToEnd"] = {"seconds": seconds, "peakBytes": peak, "outputBytes": size}
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, current):
+    """Print the relative change of every stage metric against an older result file."""
+    print(f"\nchange vs {previous.get('commit') or 'previous run'}:")
+    for size, stages in current["sizes"].items():
+        for stage, metrics in stages.items():
+            old = previous.get("sizes", {}).get(size, {}).get(stage)
+            if not old:
+                continue
+            changes = []
+            for key in ("seconds", "peakBytes", "outputBytes"):
+                if old.get(key) and metrics.get(key) is not None:
+                    changes.append(f"{key} {metrics[key] / old[key] - 1:+.1%}")
+            print(f"  {size:>8} {stage:<10} {'  '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[600, 60_000, 600_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', default='pipeline-results.json')
+    parser.add_argument('--compare', metavar='OLD_FILE')
+    args = parser.parse_args()
+
+    report = {"commit": git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+              "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z'), "repeat": args.repeat, "sizes": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'deck.json')
+        for rows in args.sizes:
+            stages = report["sizes"][str(rows)] = run_size(rows, args.repeat, path)
+            for stage, metrics in stages.items():
+                output = f"{metrics['outputBytes']:>13,} B" if metrics["outputBytes"] is not None else ' ' * 15
+                print(f"{rows:>8} {stage:<10} {metrics['seconds']:9.4f} s  "
+                      f"peak {metrics['peakBytes']:>13,} B  {output}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
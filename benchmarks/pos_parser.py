@@ -0,0 +1,64 @@
+"""Benchmark parse_pos_batch() against the old per-word re.sub() path.
+
+Usage: python benchmarks/pos_parser.py [--rows N] [--repeat R]
+
+The per-word path is the loop body the builder used to repeat for every
+topic: re.sub() with the pattern given as a string, which goes through the
+re module's cache on every call and throws the tag away.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from synthetic import synthetic_topics  # noqa: E402
+
+
+def per_item(topics):
+    for _number, _name, words, _pronounce, _meaning in topics:
+        for i in range(len(words)):
+            re.sub(r'\s*\((n|v|adj|adv)\)$', '', words[i]).strip()
+
+
+def per_topic_batch(topics):
+    for _number, _name, words, _pronounce, _meaning in topics:
+        builder.parse_pos_batch(words)
+
+
+def whole_deck_batch(topics):
+    builder.parse_pos_batch([word for _n, _name, words, _p, _m in topics for word in words])
+
+
+def best_of(repeat, func, topics):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(topics)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    topics = synthetic_topics(args.rows, untagged_every=97)
+    _cleaned, _pos, issues = builder.parse_pos_batch([w for _n, _name, words, _p, _m in topics for w in words])
+    print(f"{args.rows:,} words in {len(topics):,} topics, {len(issues):,} tag issues reported")
+
+    baseline = best_of(args.repeat, per_item, topics)
+    for label, func in (('per-word re.sub', per_item),
+                        ('batch per topic', per_topic_batch),
+                        ('batch whole deck', whole_deck_batch)):
+        elapsed = baseline if func is per_item else best_of(args.repeat, func, topics)
+        print(f"  {label:<18} {elapsed:8.3f} s  {args.rows / elapsed / 1e6:6.2f} M words/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == '__main__':
+    main()
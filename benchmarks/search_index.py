@@ -0,0 +1,89 @@
+"""Benchmark SearchIndex lookups against a linear scan of the deck.
+
+Usage: python benchmarks/search_index.py [--rows N] [--queries Q]
+
+The synthetic deck repeats the TOEIC records with a letter suffix on every
+word, so prefixes and meaning tokens have realistic fan-out. The linear
+scan gets pre-lowered words and pre-folded meanings, i.e. its best case.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from vocab_builder import search  # noqa: E402
+
+
+def letters(number):
+    text = ''
+    while True:
+        number, digit = divmod(number, 26)
+        text += chr(ord('a') + digit)
+        if not number:
+            return text
+
+
+def synthetic_deck(rows):
+    base = list(builder.iter_vocabulary_items())
+    return [{"word": base[i % len(base)]["word"] + letters(i // len(base)),
+             "pronounce": base[i % len(base)]["pronounce"],
+             "meaning": base[i % len(base)]["meaning"]} for i in range(rows)]
+
+
+def timed(func, queries):
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=500)
+    args = parser.parse_args()
+
+    deck = synthetic_deck(args.rows)
+    start = time.perf_counter()
+    index = builder.SearchIndex(builder.build_search_index(deck), [item["word"] for item in deck])
+    print(f"{args.rows:,} words, index built in {time.perf_counter() - start:.2f} s")
+
+    rng = random.Random(9)
+    picks = [deck[rng.randrange(len(deck))] for _ in range(args.queries)]
+    word_queries = [item["word"][:rng.randint(2, len(item["word"]))] for item in picks]
+    meaning_queries = [' '.join(builder.fold_diacritics(item["meaning"]).split()[-2:]) for item in picks]
+
+    lowered = [item["word"].lower() for item in deck]
+    folded = [set(search._TOKEN.findall(builder.fold_diacritics(item["meaning"]))) for item in deck]
+
+    def scan_word(query):
+        query = query.lower()
+        return [i for i, word in enumerate(lowered) if word.startswith(query)]
+
+    def scan_meaning(query):
+        tokens = set(search._TOKEN.findall(builder.fold_diacritics(query)))
+        return [i for i, meaning in enumerate(folded) if tokens <= meaning]
+
+    for query in word_queries[:20]:
+        assert index.search_word(query) == scan_word(query), query
+    for query in meaning_queries[:20]:
+        assert index.search_meaning(query) == scan_meaning(query), query
+
+    for label, func, queries in (('word prefix, index', index.search_word, word_queries),
+                                 ('word prefix, scan', scan_word, word_queries),
+                                 ('meaning, index', index.search_meaning, meaning_queries),
+                                 ('meaning, scan', scan_meaning, meaning_queries)):
+        median, p99 = timed(func, queries)
+        print(f"  {label:<20} median {median * 1000:8.3f} ms  p99 {p99 * 1000:8.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
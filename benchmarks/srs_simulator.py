@@ -0,0 +1,35 @@
+"""Time the spaced-repetition load simulator as the cohort grows.
+
+Usage: python benchmarks/srs_simulator.py [--users N ...] [--days D] [--words W]
+
+Needs numpy. Each cohort size is simulated once with the default study
+habits; the simulated (learner, word, day) cells per second show how the
+cost scales, and the totals give a feel for the projected Firestore load.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='cohort sizes to simulate')
+    parser.add_argument('--days', type=int, default=365, help='days per simulation')
+    parser.add_argument('--words', type=int, default=600, help='words in the deck')
+    args = parser.parse_args()
+
+    for users in args.users:
+        report = builder.simulate_reviews(args.words, users, args.days)
+        cells = users * args.words * args.days
+        totals = report["totals"]
+        print(f"{users:>8,} users  {report['seconds']:7.2f} s  {cells / report['seconds'] / 1e9:6.2f} G cells/s  "
+              f"{totals['reviews']:>14,} reviews  {totals['reads']:>16,} reads  {totals['writes']:>14,} writes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+"""Synthetic decks shaped like the topicN_words / _pronounce / _meaning triples."""
+
+TAGS = ('n', 'v', 'adj', 'adv')
+
+
+def synthetic_topics(rows, per_topic=12, untagged_every=0):
+    """Return (number, name, words, pronounce, meaning) blocks with unique rows.
+
+    untagged_every drops the POS tag from every n-th word, like the few
+    untagged entries in the real source lists.
+    """
+    topics = []
+    for start in range(0, rows, per_topic):
+        count = min(per_topic, rows - start)
+        ids = range(start, start + count)
+        topics.append((
+            len(topics) + 1,
+            f"Topic {len(topics) + 1}",
+            [f"word{i}" if untagged_every and i % untagged_every == 0 else f"word{i} ({TAGS[i % 4]})" for i in ids],
+            [f"/wɜ:d{i}/" for i in ids],
+            [f"nghĩa của từ số {i}" for i in ids],
+        ))
+    return topics
@@ -0,0 +1,63 @@
+"""Compare the memory held by list-of-dicts decks and VocabularyTable decks.
+
+Usage: python benchmarks/table_memory.py [--decks N] [--synthetic ROWS]
+
+Each layout is built inside its own tracemalloc window and kept alive until
+the measurement is taken, so "retained" is what the decks cost while held
+and "peak" includes the temporaries of building them.
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import vocab_builder as builder  # noqa: E402
+from synthetic import synthetic_topics  # noqa: E402
+
+
+def measure(build):
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current, peak
+
+
+def build_tables(load_topics, decks):
+    pool = builder.StringPool()
+    tables = [builder.VocabularyTable.from_topics(load_topics(), pool) for _ in range(decks)]
+    pool.compact()
+    return tables
+
+
+def report(label, load_topics, decks):
+    rows = sum(len(words) for _n, _name, words, _p, _m in load_topics()) * decks
+    dicts = measure(lambda: [list(builder.iter_vocabulary_items(load_topics())) for _ in range(decks)])
+    table = measure(lambda: build_tables(load_topics, decks))
+    print(f"{label}: {decks} deck(s), {rows} rows")
+    for name, (current, peak) in (('list of dicts', dicts), ('VocabularyTable', table)):
+        print(f"  {name:<16} retained {current:>12,} B ({current / rows:6.1f} B/row)  peak {peak:>12,} B")
+    print(f"  saving: {1 - table[0] / dicts[0]:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--decks', type=int, default=10, help='copies of the TOEIC deck held at once')
+    parser.add_argument('--synthetic', type=int, default=60000, help='rows in the synthetic unique-word deck')
+    args = parser.parse_args()
+
+    # The TOEIC topic lists are loaded before tracing, so only the deck
+    # structures are counted; the synthetic deck is generated inside the
+    # traced window, so both layouts also pay for owning their strings.
+    builder.default_topics()
+    report('TOEIC 600', builder.default_topics, args.decks)
+    report('synthetic', lambda: synthetic_topics(args.synthetic), 1)
+
+
+if __name__ == '__main__':
+    main()
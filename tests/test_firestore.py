@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from vocab_builder.firestore import (
+    InMemoryWriteBatch,
+    firestore_doc_size,
+    iter_firestore_chunks,
+    replay_firestore_payload,
+    to_firestore_word,
+    write_firestore_payload,
+)
+
+
+def _records(count):
+    return [{"word": f"word{index}", "pronounce": f"/w{index}/", "meaning": f"nghĩa {index}",
+             "partOfSpeech": "noun", "category": "Contracts"} for index in range(count)]
+
+
+@pytest.mark.parametrize("count, max_operations, sizes", [
+    (6, 3, [3, 3]),
+    (7, 3, [3, 3, 1]),
+    (2, 3, [2]),
+    (3, 1, [1, 1, 1]),
+    (0, 3, []),
+])
+def test_chunk_boundaries(count, max_operations, sizes):
+    chunks = list(iter_firestore_chunks(_records(count), max_operations))
+    assert [chunk["operations"] for chunk in chunks] == sizes
+    assert [doc["word"] for chunk in chunks for doc in chunk["words"]] == [f"word{index}" for index in range(count)]
+
+
+def test_chunks_respect_the_byte_limit():
+    records = _records(5)
+    doc_size = firestore_doc_size(to_firestore_word(records[0]))
+    chunks = list(iter_firestore_chunks(records, 500, max_bytes=2 * doc_size))
+    assert [chunk["operations"] for chunk in chunks] == [2, 2, 1]
+    assert all(chunk["bytes"] <= 2 * doc_size for chunk in chunks)
+
+
+def test_replay_small_chunks(tmp_path):
+    path = str(tmp_path / "deck.firestore.json")
+    assert write_firestore_payload(path, _records(7), max_operations=3) == (7, 3)
+    store = replay_firestore_payload(path)
+    assert len(store) == 7
+    assert sorted(doc["word"] for doc in store.values()) == sorted(f"word{index}" for index in range(7))
+    assert all(doc["status"] == "new" and doc["userId"] for doc in store.values())
+
+
+def test_replay_rejects_an_oversized_chunk(tmp_path):
+    path = str(tmp_path / "deck.firestore.json")
+    write_firestore_payload(path, _records(4), max_operations=4)
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    payload["maxOperations"] = 3
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    with pytest.raises(RuntimeError, match="exceeds 3 operations"):
+        replay_firestore_payload(path)
+
+
+def test_replay_rejects_a_wrong_declared_count(tmp_path):
+    path = str(tmp_path / "deck.firestore.json")
+    write_firestore_payload(path, _records(4), max_operations=2)
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    payload["chunks"][1]["operations"] = 3
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    with pytest.raises(AssertionError, match="Chunk 1 declares 3 operations"):
+        replay_firestore_payload(path)
+
+
+def test_batch_limits():
+    store = {}
+    batch = InMemoryWriteBatch(store, max_operations=2)
+    batch.set("a", {"word": "a"})
+    batch.set("b", {"word": "b"})
+    with pytest.raises(RuntimeError, match="exceeds 2 operations"):
+        batch.set("c", {"word": "c"})
+    batch.commit()
+    assert set(store) == {"a", "b"}
+    with pytest.raises(RuntimeError, match="after commit"):
+        batch.set("d", {"word": "d"})
+
+    small = InMemoryWriteBatch({}, max_bytes=firestore_doc_size({"word": "a"}))
+    small.set("a", {"word": "a"})
+    with pytest.raises(RuntimeError, match="bytes"):
+        small.set("b", {"word": "b"})
+
+
+def test_over_limit_inputs():
+    with pytest.raises(ValueError, match="at least 1"):
+        list(iter_firestore_chunks(_records(1), 0))
+    with pytest.raises(ValueError, match="chunk limit"):
+        list(iter_firestore_chunks(_records(1), 500, max_bytes=10))
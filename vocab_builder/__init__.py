@@ -0,0 +1,144 @@
+"""Build the app's TOEIC vocabulary asset from topic source files.
+
+Importing the package has no side effects and loads nothing heavy: the
+names below are resolved from their submodules on first access.
+
+    >>> import vocab_builder
+    >>> records = list(vocab_builder.build_deck())
+
+The command line entry point is ``python -m vocab_builder`` (see cli.py).
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # sources
+    "DEFAULT_SOURCE": "sources",
+    "SOURCE_FORMATS": "sources",
+    "default_topics": "sources",
+    "load_topics": "sources",
+    "save_topics": "sources",
+    "iter_tsv_topics": "sources",
+    "iter_csv_topics": "sources",
+    "iter_ndjson_topics": "sources",
+    "write_tsv_topics": "sources",
+    "write_csv_topics": "sources",
+    "write_ndjson_topics": "sources",
+    # pipeline
+    "POS_NAMES": "pipeline",
+    "build_deck": "pipeline",
+    "parse_pos_batch": "pipeline",
+    "iter_topic_records": "pipeline",
+    "iter_vocabulary_items": "pipeline",
+    "write_json_array": "pipeline",
+    "format_array_item": "pipeline",
+    # profiling
+    "BuildProfile": "profiling",
+    "start_profile": "profiling",
+    "stop_profile": "profiling",
+    # validation
+    "PROBLEM_SEVERITY": "validation",
+    "validate_topic": "validation",
+    "validate_topics": "validation",
+    # formats
+    "OUTPUT_FORMATS": "formats",
+    "COMPRESSIONS": "formats",
+    "write_formats": "formats",
+    "encode_dict": "formats",
+    "decode_dict": "formats",
+    "parse_seconds": "formats",
+    # incremental
+    "build_incremental": "incremental",
+    "manifest_path_for": "incremental",
+    "topic_hash": "incremental",
+    # multideck
+    "build_decks": "multideck",
+    "deck_name": "multideck",
+    # delta
+    "record_id": "delta",
+    "with_ids": "delta",
+    "read_records": "delta",
+    "diff_decks": "delta",
+    "apply_patch": "delta",
+    # shards
+    "remove_stale_files": "shards",
+    "shard_file_name": "shards",
+    "write_shards": "shards",
+    # ipa
+    "IPA_GLYPHS": "ipa",
+    "normalize_ipa": "ipa",
+    "normalize_pronunciations": "ipa",
+    # dedup
+    "normalize_text": "dedup",
+    "dedup_records": "dedup",
+    # distractors
+    "DEFAULT_DISTRACTORS": "distractors",
+    "pick_distractors": "distractors",
+    "add_distractors": "distractors",
+    # enrich
+    "ENRICHED_FIELDS": "enrich",
+    "CorpusBackend": "enrich",
+    "HttpBackend": "enrich",
+    "EnrichmentCache": "enrich",
+    "open_backend": "enrich",
+    "enrich_records": "enrich",
+    "enrich_records_async": "enrich",
+    # search
+    "fold_diacritics": "search",
+    "trigrams": "search",
+    "build_search_index": "search",
+    "write_search_index": "search",
+    "intersect_sorted": "search",
+    "SearchIndex": "search",
+    # collation
+    "vietnamese_sort_key": "collation",
+    "english_sort_key": "collation",
+    "sort_orders": "collation",
+    "write_sort_orders": "collation",
+    # studypacks
+    "DEFAULT_PACK_SIZE": "studypacks",
+    "plan_study_packs": "studypacks",
+    "write_study_packs": "studypacks",
+    # lookup
+    "write_lookup": "lookup",
+    "LookupEntry": "lookup",
+    "LookupFile": "lookup",
+    # database
+    "SqliteExport": "database",
+    "write_sqlite": "database",
+    # firestore
+    "FIRESTORE_MAX_OPERATIONS": "firestore",
+    "FIRESTORE_MAX_REQUEST_BYTES": "firestore",
+    "firestore_doc_size": "firestore",
+    "to_firestore_word": "firestore",
+    "iter_firestore_chunks": "firestore",
+    "write_firestore_payload": "firestore",
+    "replay_firestore_payload": "firestore",
+    "InMemoryWriteBatch": "firestore",
+    # simulate
+    "BASE_INTERVALS": "simulate",
+    "EASE_FACTOR": "simulate",
+    "next_mastery": "simulate",
+    "review_interval": "simulate",
+    "simulate_reviews": "simulate",
+    # table
+    "StringPool": "table",
+    "SHARED_POOL": "table",
+    "VocabularyRow": "table",
+    "VocabularyTable": "table",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
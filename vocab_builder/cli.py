@@ -0,0 +1,460 @@
+"""Command line entry point: python -m vocab_builder COMMAND.
+
+Commands: build, build-decks, validate, stats, simulate and convert.
+
+Only argparse is imported up front; every subcommand imports the modules it
+needs when it runs, so --help and the small subcommands start quickly.
+"""
+import argparse
+import sys
+
+DEFAULT_OUTPUT = 'toeic_600_vocabulary.json'
+
+
+def _add_source(parser):
+    parser.add_argument('--source', default=None,
+                        help="topic file to read, .tsv/.csv/.ndjson (default: the bundled TOEIC 600 deck)")
+
+
+def _load(args, parser, strict=True):
+    """The topics of --source, with loader errors reported through parser.error()."""
+    import os
+
+    from .sources import DEFAULT_SOURCE, load_topics
+
+    path = args.source or DEFAULT_SOURCE
+    if not os.path.isfile(path):
+        parser.error(f"--source: no such file {path!r}")
+    try:
+        topics = load_topics(path, strict)
+    except ValueError as error:
+        parser.error(f"--source: {error}")
+    return _reporting_errors(topics, parser)
+
+
+def _reporting_errors(topics, parser):
+    # the loaders are lazy, so malformed rows only surface while the topics are read
+    try:
+        yield from topics
+    except (OSError, ValueError) as error:
+        parser.error(f"--source: {error}")
+
+
+def _print_json(data):
+    import json
+
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def cmd_build(args, parser):
+    import json
+    import os
+
+    from .pipeline import iter_vocabulary_items, write_json_array
+
+    formats = args.formats or []
+    if formats or args.compress:
+        from .formats import COMPRESSIONS, OUTPUT_FORMATS, brotli
+
+        for name in formats:
+            if name not in OUTPUT_FORMATS:
+                parser.error(f"--format: unknown format {name!r} (choose from {', '.join(sorted(OUTPUT_FORMATS))})")
+        for kind in args.compress:
+            if kind not in COMPRESSIONS:
+                parser.error(f"--compress: unknown compression {kind!r} (choose from {', '.join(COMPRESSIONS)})")
+        if 'br' in args.compress and brotli is None:
+            parser.error("--compress br needs the 'brotli' package (pip install brotli)")
+
+    if args.distractors < 0:
+        parser.error("--distractors: K must be at least 1 (or 0 for none)")
+    if args.sharded or args.incremental:
+        # these outputs are written from the topics, so stages that change the
+        # records would be lost, and each replaces the main output, as the
+        # --format files do
+        changed = [flag for flag, value in (("--normalize-ipa", args.normalize_ipa), ("--dedup", args.dedup),
+                                            ("--enrich", args.enrich), ("--distractors", args.distractors),
+                                            ("--ids", args.ids), ("--diff", args.diff), ("--format", formats),
+                                            ("--compress", args.compress),
+                                            ("--incremental", args.sharded and args.incremental)) if value]
+        if changed:
+            parser.error(f"{'--sharded' if args.sharded else '--incremental'} cannot be combined with "
+                         f"{', '.join(changed)}")
+
+    if args.profile:
+        from .profiling import start_profile
+
+        start_profile(cprofile=args.cprofile)
+
+    topics = _load(args, parser)
+    if args.sharded or args.incremental:
+        # load_topics() is a one-shot generator and these outputs read the
+        # topics themselves, after any stage that materializes the records
+        topics = list(topics)
+    json_file_path = args.output
+    stem = os.path.splitext(json_file_path)[0]
+    items = iter_vocabulary_items(topics, tagged=args.firestore or args.dedup or bool(args.distractors)
+                                  or args.ids or bool(args.diff) or bool(args.enrich) or args.sort_orders
+                                  or bool(args.study_packs) or args.sqlite)
+    if args.normalize_ipa:
+        from .ipa import normalize_pronunciations
+
+        items, ipa_report = normalize_pronunciations(items)
+        ipa_report_path = stem + '.ipa.json'
+        with open(ipa_report_path, 'w', encoding='utf-8') as f:
+            json.dump(ipa_report, f, ensure_ascii=False, indent=2)
+        print(f"Repaired {ipa_report['repaired']} of {ipa_report['records']} pronunciations "
+              f"({ipa_report['strings']} distinct); {len(ipa_report['flagged'])} flagged in {ipa_report_path}.")
+    if args.dedup:
+        from .dedup import dedup_records
+
+        items, dedup_report = dedup_records(items)
+        print(f"Merged {dedup_report['input']} records into {dedup_report['output']} "
+              f"({dedup_report['writesSaved']} writes saved per import).")
+    if args.enrich:
+        from .enrich import enrich_records, open_backend
+
+        try:
+            backend = open_backend(args.enrich)
+        except (OSError, ValueError) as error:
+            parser.error(f"--enrich: {error}")
+        cache_path = args.enrich_cache or stem + '.enrich-cache.ndjson'
+        items, enrich_report = enrich_records(items, backend, cache_path=cache_path,
+                                              concurrency=args.enrich_concurrency)
+        print(f"Enriched {enrich_report['enriched']} of {enrich_report['records']} records "
+              f"from {enrich_report['keys']} words: {enrich_report['cacheHits']} cached, "
+              f"{enrich_report['backendCalls']} looked up, "
+              f"{enrich_report['retries']} retries, {enrich_report['failures']} failed "
+              f"({enrich_report['seconds']:.2f} s).")
+        if enrich_report["cacheStale"]:
+            print(f"Ignored the answers in {cache_path}, which came from another backend or corpus version.")
+        for failure in enrich_report["errors"]:
+            print(f"  {failure['word']} ({failure['partOfSpeech'] or 'no POS'}): {failure['error']}", file=sys.stderr)
+    if args.distractors:
+        from .distractors import add_distractors
+
+        # distractor ids are positions in the written deck
+        items = add_distractors(items, args.distractors)
+        short = sum(1 for item in items if len(item["distractors"]) < args.distractors)
+        print(f"Picked {args.distractors} quiz distractors for {len(items) - short} of {len(items)} records.")
+    if args.ids or args.diff:
+        from .delta import with_ids
+
+        items = with_ids(items)
+    if args.diff:
+        from .delta import diff_decks, read_records, write_patch
+
+        items = list(items)
+        try:
+            previous = read_records(args.diff)
+            patch = diff_decks(previous, items)
+        except (OSError, ValueError, KeyError) as error:
+            parser.error(f"--diff: cannot compare with {args.diff}: {error}")
+        patch_path = stem + '.patch.json'
+        write_patch(patch_path, patch)
+        print(f"Successfully created {patch_path}: {len(patch['added'])} added, {len(patch['changed'])} changed, "
+              f"{len(patch['removed'])} removed, {patch['unchanged']} unchanged.")
+    if args.search_index:
+        from .search import write_search_index
+
+        # record ids in the index are positions in the written deck
+        items = list(items)
+        index_path = stem + '.search.json'
+        search_index = write_search_index(index_path, items)
+        print(f"Successfully created {index_path} with {len(search_index['prefix'])} prefixes, "
+              f"{len(search_index['trigram'])} trigrams and {len(search_index['meaning'])} meaning tokens.")
+    if args.sort_orders:
+        from .collation import write_sort_orders
+
+        # positions in the orders are positions in the written deck
+        items = list(items)
+        orders_path = stem + '.orders.json'
+        orders = write_sort_orders(orders_path, items)
+        print(f"Successfully created {orders_path} with {len(orders['orders'])} sort orders "
+              f"over {orders['records']} records.")
+    if args.study_packs:
+        from .studypacks import write_study_packs
+
+        items = list(items)
+        packs_dir = stem + '.packs'
+        try:
+            packs_index = write_study_packs(packs_dir, items, args.study_packs, args.pack_seed)
+        except ValueError as error:
+            parser.error(f"--study-packs: {error}")
+        first = packs_index["packs"][0] if packs_index["packs"] else {"bytes": 0}
+        print(f"Successfully created {len(packs_index['packs'])} daily study packs in {packs_dir}/ "
+              f"(first pack {first['bytes']:,} B).")
+    if args.lookup:
+        from .lookup import write_lookup
+
+        items = list(items)
+        lookup_path = stem + '.lookup.bin'
+        entry_count = write_lookup(lookup_path, items)
+        print(f"Successfully created {lookup_path} with {entry_count} headword entries.")
+    if args.firestore:
+        from .firestore import FIRESTORE_MAX_OPERATIONS, replay_firestore_payload, write_firestore_payload
+
+        # an extra output next to the deck, so the records are needed twice
+        items = list(items)
+        payload_path = stem + '.firestore.json'
+        max_operations = FIRESTORE_MAX_OPERATIONS if args.max_operations is None else args.max_operations
+        try:
+            word_count, chunk_count = write_firestore_payload(payload_path, items, max_operations)
+        except ValueError as error:
+            parser.error(f"--max-operations: {error}")
+        replayed = replay_firestore_payload(payload_path)
+        print(f"Successfully created {payload_path} with {word_count} words in {chunk_count} chunks "
+              f"(replayed {len(replayed)} writes).")
+    sqlite_export = None
+    if args.sqlite:
+        from .database import SqliteExport
+
+        # the database is filled from the same record stream the output below consumes
+        sqlite_export = SqliteExport(stem + '.sqlite')
+        items = sqlite_export.feed(items)
+
+    if formats or args.compress:
+        from .formats import write_formats
+
+        reports = write_formats(stem, items, formats or ["pretty"], args.compress)
+        for report in reports:
+            sizes = "  ".join(f"{kind} {size:,} B" for kind, size in report["bytes"].items())
+            print(f"{report['file']:<32} {report['count']} items  {sizes}  "
+                  f"parse {report['parseSeconds'] * 1000:.2f} ms")
+    elif args.sharded:
+        from .shards import write_shards
+
+        index = write_shards(stem, topics)
+        print(f"Successfully created {len(index['shards'])} topic shards in {stem}/ "
+              f"with {index['wordCount']} vocabulary items.")
+    elif args.incremental:
+        from .incremental import build_incremental
+
+        item_count, rebuilt = build_incremental(json_file_path, topics)
+        if not rebuilt:
+            print(f"{json_file_path} is up to date with {item_count} vocabulary items.")
+        else:
+            print(f"Rebuilt {len(rebuilt)} of {len(topics)} topics in {json_file_path} ({item_count} vocabulary items).")
+    else:
+        # the loaders can fail partway through a source, so the previous
+        # output is only replaced after a complete pass
+        temp_path = json_file_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                item_count = write_json_array(items, f)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, json_file_path)
+
+        print(f"Successfully created {json_file_path} with {item_count} vocabulary items.")
+
+    if sqlite_export is not None:
+        export = sqlite_export.finish()
+        search = "word/meaning full-text search" if export["fts"] else "no full-text search (SQLite lacks FTS5)"
+        print(f"Successfully created {export['file']} with {export['records']} rows, "
+              f"word/topic/POS indexes and {search}.")
+
+    if args.profile:
+        from .profiling import stop_profile
+
+        stats = stop_profile(stem + '.prof' if args.cprofile else None)
+        with open(stem + '.profile.json', 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        stage_summary = ", ".join(f"{stage} {totals['seconds'] * 1000:.1f} ms" for stage, totals in stats["stages"].items())
+        print(f"Profile written to {stem}.profile.json ({stage_summary}).")
+    return 0
+
+
+def cmd_validate(args, parser):
+    from .validation import validate_topics
+
+    # malformed rows are loaded as ragged blocks, which validation reports
+    report = validate_topics(_load(args, parser, strict=False), workers=args.workers)
+    _print_json(report)
+    return 1 if report["errors"] or (args.strict and report["warnings"]) else 0
+
+
+def cmd_stats(args, parser):
+    from .pipeline import POS_NAMES, parse_pos_batch
+
+    counts = dict.fromkeys(POS_NAMES.values(), 0)
+    topics = []
+    untagged = 0
+    for number, name, words, _pronounce, _meaning in _load(args, parser):
+        _cleaned, pos, issues = parse_pos_batch(words)
+        for tag in pos:
+            if tag:
+                counts[tag] += 1
+        untagged += len(issues)
+        topics.append({"topic": number, "name": name, "words": len(words)})
+    _print_json({"topics": len(topics), "words": sum(topic["words"] for topic in topics),
+                 "partOfSpeech": counts, "untagged": untagged, "perTopic": topics})
+    return 0
+
+
+def cmd_simulate(args, parser):
+    import json
+
+    from . import simulate
+    from .pipeline import iter_vocabulary_items
+
+    if simulate.np is None:
+        parser.error("simulate needs the 'numpy' package (pip install numpy)")
+    try:
+        performance = [float(weight) for weight in args.performance.split(',')]
+    except ValueError:
+        parser.error(f"--performance: expected three comma-separated weights, got {args.performance!r}")
+    words = sum(1 for _record in iter_vocabulary_items(_load(args, parser)))
+    try:
+        report = simulate.simulate_reviews(words, args.users, args.days, args.new_per_day, args.active_rate,
+                                           performance, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    totals, peak = report["totals"], report["peak"]
+    print(f"Simulated {args.users:,} learners x {words} words x {args.days} days in {report['seconds']:.2f} s: "
+          f"{totals['reviews']:,} reviews, {totals['reads']:,} reads, {totals['writes']:,} writes.")
+    if peak is not None:
+        print(f"Peak day {peak['day']}: {peak['reviews']:,} reviews, {peak['reads']:,} reads, "
+              f"{peak['writes']:,} writes.")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Report written to {args.output}.")
+    return 0
+
+
+def cmd_build_decks(args, parser):
+    import os
+
+    from .multideck import build_decks, write_overlap_report
+
+    try:
+        _tables, report = build_decks(args.sources, args.out_dir, args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    for deck in report["decks"]:
+        print(f"{deck['output']:<40} {deck['records']:>8,} items  {deck['seconds']:7.2f} s")
+    report_path = args.report or os.path.join(args.out_dir, 'overlap.json')
+    write_overlap_report(report_path, report)
+    shared = ", ".join(f"{field} {counts['inSeveralDecks']:,} of {counts['distinct']:,}"
+                       for field, counts in report["fields"].items())
+    print(f"Built {len(report['decks'])} decks in {report['seconds']:.2f} s; strings in several decks: {shared}. "
+          f"Overlap report written to {report_path}.")
+    return 0
+
+
+def cmd_convert(args, parser):
+    from .sources import save_topics
+
+    try:
+        save_topics(args.destination, _load(args, parser))
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Successfully converted {args.source or 'the TOEIC 600 deck'} to {args.destination}.")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='vocab_builder', description="Build the TOEIC 600 vocabulary JSON file.")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    build = commands.add_parser('build', help="write the vocabulary JSON file and any extra outputs")
+    _add_source(build)
+    build.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                       help="vocabulary JSON file to write; extra outputs are named after it (default: %(default)s)")
+    build.add_argument('--profile', action='store_true',
+                       help="time each build stage and write a JSON stats report next to the output")
+    build.add_argument('--cprofile', action='store_true',
+                       help="with --profile, also capture the run with cProfile into a .prof file")
+    build.add_argument('--incremental', action='store_true',
+                       help="only reprocess topics whose source lists changed since the last incremental build")
+    build.add_argument('--sharded', action='store_true',
+                       help="write one file per topic plus an index.json manifest into a directory named after the output")
+    build.add_argument('--firestore', action='store_true',
+                       help="also write the chunked Firestore import payload and replay it against an in-memory batch writer")
+    build.add_argument('--max-operations', type=int, default=None,
+                       help="largest number of writes per Firestore payload chunk (default: 500)")
+    build.add_argument('--search-index', action='store_true',
+                       help="also write a prefix/trigram/meaning search index for the deck")
+    build.add_argument('--sort-orders', action='store_true',
+                       help="also write precomputed alphabetical, meaning, topic and part-of-speech orderings")
+    build.add_argument('--study-packs', type=int, default=0, metavar='N',
+                       help="also split the deck into daily study packs of N words, balanced across topics "
+                            "and parts of speech (the app's first session uses about 20)")
+    build.add_argument('--pack-seed', type=int, default=0,
+                       help="random seed for --study-packs (default: %(default)s)")
+    build.add_argument('--lookup', action='store_true',
+                       help="also write a binary headword lookup file for memory-mapped random access")
+    build.add_argument('--normalize-ipa', action='store_true',
+                       help="repair OCR-damaged pronunciations and write a report of the ones left to fix by hand")
+    build.add_argument('--dedup', action='store_true',
+                       help="merge words repeated across topics by (word, part of speech) before writing")
+    build.add_argument('--distractors', type=int, default=0, metavar='K',
+                       help="embed K precomputed wrong-answer meanings per record for the quiz (the app uses 3)")
+    build.add_argument('--enrich', metavar='SOURCE',
+                       help="fill in example sentences, parts of speech and categories from an example-sentence "
+                            "corpus file (word, partOfSpeech, example TSV) or an http(s):// lookup service")
+    build.add_argument('--enrich-cache', metavar='PATH',
+                       help="NDJSON cache of enrichment answers, reused across runs (default: next to the output)")
+    build.add_argument('--enrich-concurrency', type=int, default=8, metavar='N',
+                       help="enrichment lookups in flight at once (default: %(default)s)")
+    build.add_argument('--ids', action='store_true',
+                       help="give every record a stable id derived from its word, part of speech and topic")
+    build.add_argument('--diff', metavar='PREVIOUS',
+                       help="also write a patch of added, changed and removed records since the PREVIOUS build "
+                            "(implies --ids)")
+    build.add_argument('--sqlite', action='store_true',
+                       help="also write the deck into a SQLite database with word, topic and POS indexes "
+                            "and an FTS5 table over word and meaning")
+    build.add_argument('--format', action='append', dest='formats', metavar='FORMAT',
+                       help="output format to write (pretty, min, ndjson, tuples, dict), can be repeated (default: pretty)")
+    build.add_argument('--compress', action='append', default=[], metavar='KIND',
+                       help="also write a precompressed sibling (gz, br) of every output, can be repeated")
+    build.set_defaults(handler=cmd_build)
+
+    build_many = commands.add_parser('build-decks', help="build several decks in parallel and report their overlap")
+    build_many.add_argument('sources', nargs='+', metavar='SOURCE', help="topic files to build, .tsv/.csv/.ndjson")
+    build_many.add_argument('--out-dir', default='decks',
+                            help="directory for the <deck>.json outputs (default: %(default)s)")
+    build_many.add_argument('--workers', type=int, default=None,
+                            help="processes to build decks with (default: one per CPU)")
+    build_many.add_argument('--report', help="overlap report to write (default: OUT_DIR/overlap.json)")
+    build_many.set_defaults(handler=cmd_build_decks)
+
+    validate = commands.add_parser('validate', help="check every topic's parallel lists and print a JSON problem report")
+    _add_source(validate)
+    validate.add_argument('--strict', action='store_true', help="also fail on warnings")
+    validate.add_argument('--workers', type=int, default=None,
+                          help="processes to check large decks with (default: one per CPU)")
+    validate.set_defaults(handler=cmd_validate)
+
+    stats = commands.add_parser('stats', help="print word and part-of-speech counts as JSON")
+    _add_source(stats)
+    stats.set_defaults(handler=cmd_stats)
+
+    simulate = commands.add_parser('simulate', help="project daily Firestore reviews, reads and writes for a cohort")
+    _add_source(simulate)
+    simulate.add_argument('--users', type=int, default=1000, help="learners in the cohort (default: %(default)s)")
+    simulate.add_argument('--days', type=int, default=365, help="days to simulate (default: %(default)s)")
+    simulate.add_argument('--new-per-day', type=int, default=12,
+                          help="unseen words a learner starts per study day (default: %(default)s)")
+    simulate.add_argument('--active-rate', type=float, default=0.7,
+                          help="chance a learner studies on a given day (default: %(default)s)")
+    simulate.add_argument('--performance', default='0.2,0.6,0.2',
+                          help="weights of difficult,ok,easy review results (default: %(default)s)")
+    simulate.add_argument('--seed', type=int, default=0, help="random seed (default: %(default)s)")
+    simulate.add_argument('-o', '--output', help="also write the full daily report as JSON to this file")
+    simulate.set_defaults(handler=cmd_simulate)
+
+    convert = commands.add_parser('convert', help="convert the source topics to another source format")
+    _add_source(convert)
+    convert.add_argument('destination', help="file to write, .tsv/.csv/.ndjson")
+    convert.set_defaults(handler=cmd_convert)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    return args.handler(args, parser)
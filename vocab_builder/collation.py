@@ -0,0 +1,140 @@
+"""Collation keys and precomputed sort orders for the deck."""
+import json
+import unicodedata
+
+from .pipeline import POS_NAMES
+
+# Vietnamese alphabet order, with the Latin letters it lacks (f, j, w, z) in
+# their usual places so English loanwords in meanings still sort sensibly
+VIETNAMESE_ALPHABET = ('a', 'ă', 'â', 'b', 'c', 'd', 'đ', 'e', 'ê', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n',
+                       'o', 'ô', 'ơ', 'p', 'q', 'r', 's', 't', 'u', 'ư', 'v', 'w', 'x', 'y', 'z')
+
+# Tone marks as combining characters, in dictionary order after the level
+# tone: huyền, hỏi, ngã, sắc, nặng
+VIETNAMESE_TONES = ('\u0300', '\u0309', '\u0303', '\u0301', '\u0323')
+
+# Marks that make a different letter rather than a tone: breve, circumflex, horn
+_LETTER_MARKS = frozenset('\u0306\u0302\u031b')
+
+# Primary weights: spaces first, then digits, then letters; other punctuation
+# is ignored at the primary level
+_SPACE_WEIGHT = 1
+_DIGIT_BASE = 2
+_LETTER_BASE = _DIGIT_BASE + 10
+_LETTER_WEIGHTS = {letter: _LETTER_BASE + index for index, letter in enumerate(VIETNAMESE_ALPHABET)}
+
+# Order of parts of speech in the by-POS ordering; untagged words go last
+POS_ORDER = tuple(POS_NAMES.values()) + ("",)
+
+# Per-character (primary weight, tone) pairs, filled in as characters are seen
+_char_weights = {}
+
+
+def _weights(char):
+    weights = _char_weights.get(char)
+    if weights is None:
+        decomposed = unicodedata.normalize('NFD', char.lower())
+        base = decomposed[:1]
+        letter = base + ''.join(mark for mark in decomposed[1:] if mark in _LETTER_MARKS)
+        letter = unicodedata.normalize('NFC', letter)
+        tones = [VIETNAMESE_TONES.index(mark) + 1 for mark in decomposed[1:] if mark in VIETNAMESE_TONES]
+        if letter in _LETTER_WEIGHTS:
+            primary = _LETTER_WEIGHTS[letter]
+        elif '0' <= base <= '9':
+            primary = _DIGIT_BASE + int(base)
+        elif base.isspace():
+            primary = _SPACE_WEIGHT
+        elif base.isalpha():
+            # letters outside the alphabet sort after it, by code point
+            primary = min(_LETTER_BASE + len(VIETNAMESE_ALPHABET) + ord(base), 0x10FFFF)
+        else:
+            primary = 0
+        weights = _char_weights[char] = (primary, tones[0] if tones else 0)
+    return weights
+
+
+def vietnamese_sort_key(text):
+    """Collation key that orders Vietnamese text as a dictionary does.
+
+    Letters compare by the Vietnamese alphabet (a < ă < â < b ... d < đ),
+    then, between otherwise equal strings, by tone from left to right
+    (level < huyền < hỏi < ngã < sắc < nặng), then case-insensitively,
+    then by code point. Runs of whitespace count as one space and other
+    punctuation is ignored unless everything else is equal.
+    """
+    text = unicodedata.normalize('NFC', ' '.join(text.split()))
+    primary, tones = [], []
+    for char in text:
+        weight, tone = _weights(char)
+        if weight:
+            primary.append(chr(weight))
+            tones.append(chr(tone + 1))
+    return ''.join(primary), ''.join(tones), text.casefold(), text
+
+
+def english_sort_key(word):
+    """Collation key for English headwords: letter by letter, ignoring case, spaces and hyphens.
+
+    "check-in" sorts with "checkin", after "check"; ties fall back to the
+    case-folded form and then to the word itself, so the order is total.
+    """
+    folded = unicodedata.normalize('NFKD', word.casefold())
+    letters = ''.join(char for char in folded if char.isalnum())
+    return letters, word.casefold(), word
+
+
+def sort_orders(items):
+    """Precompute the deck's common sort orders as permutations of record positions.
+
+    Returns {"records", "orders", "groups"}: orders maps "alphabetical"
+    (by headword), "meaning" (by Vietnamese meaning), "topic" (topics in
+    deck order, headwords alphabetical within each) and "partOfSpeech"
+    (noun, verb, adjective, adverb, untagged, alphabetical within each) to
+    lists of positions, and groups gives the [start, end) span of every
+    topic and part of speech in its ordering, so section headers need no
+    scan either. Records must be tagged for the topic and POS orders.
+    Collation keys are computed once per record and sorts are stable.
+    """
+    items = list(items)
+    positions = range(len(items))
+    word_keys = [english_sort_key(item["word"]) for item in items]
+    meaning_keys = [vietnamese_sort_key(item["meaning"]) for item in items]
+    topic_rank = {}
+    for item in items:
+        topic_rank.setdefault(item.get("category", ""), len(topic_rank))
+    pos_rank = {pos: rank for rank, pos in enumerate(POS_ORDER)}
+    alphabetical = sorted(positions, key=word_keys.__getitem__)
+    # stable sorts of the alphabetical order keep headwords alphabetical within each group
+    by_topic = sorted(alphabetical, key=lambda position: topic_rank[items[position].get("category", "")])
+    by_pos = sorted(alphabetical, key=lambda position: pos_rank.get(items[position].get("partOfSpeech", ""),
+                                                                     len(POS_ORDER)))
+    groups = {"topic": _spans(by_topic, items, "category"), "partOfSpeech": _spans(by_pos, items, "partOfSpeech")}
+    return {
+        "records": len(items),
+        "orders": {
+            "alphabetical": alphabetical,
+            "meaning": sorted(positions, key=meaning_keys.__getitem__),
+            "topic": by_topic,
+            "partOfSpeech": by_pos,
+        },
+        "groups": groups,
+    }
+
+
+def _spans(order, items, field):
+    spans = {}
+    for index, position in enumerate(order):
+        value = items[position].get(field, "")
+        span = spans.get(value)
+        if span is None:
+            spans[value] = [index, index + 1]
+        else:
+            span[1] = index + 1
+    return spans
+
+
+def write_sort_orders(path, items):
+    orders = sort_orders(items)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(orders, f, ensure_ascii=False, separators=(',', ':'))
+    return orders
@@ -0,0 +1,152 @@
+"""SQLite export of the deck, with secondary indexes and full-text search."""
+import json
+import os
+import sqlite3
+
+from .search import fold_diacritics
+
+# Record fields with a column of their own; anything else goes into "extra" as JSON
+WORD_COLUMNS = (("id", "record_id"), ("word", "word"), ("pronounce", "pronounce"), ("meaning", "meaning"),
+                ("partOfSpeech", "part_of_speech"), ("category", "topic"), ("example", "example"))
+_COLUMN_FIELDS = frozenset(field for field, _column in WORD_COLUMNS)
+
+# Rows per executemany() call
+INSERT_BATCH = 10000
+
+_SCHEMA = """
+CREATE TABLE words (
+    position INTEGER PRIMARY KEY,
+    record_id TEXT,
+    word TEXT NOT NULL COLLATE NOCASE,
+    pronounce TEXT,
+    meaning TEXT,
+    part_of_speech TEXT,
+    topic TEXT,
+    example TEXT,
+    extra TEXT
+);
+"""
+
+# Built after the rows are in, which is faster than maintaining them per insert.
+# word is declared COLLATE NOCASE, so its index serves plain word = ? lookups
+# case-insensitively
+_INDEXES = """
+CREATE INDEX words_word ON words (word);
+CREATE INDEX words_topic ON words (topic);
+CREATE INDEX words_part_of_speech ON words (part_of_speech);
+CREATE UNIQUE INDEX words_record_id ON words (record_id) WHERE record_id IS NOT NULL;
+"""
+
+# Contentless FTS5 table keyed by position (join words on it for the
+# columns). meaning_folded is the meaning through fold_diacritics(), which
+# also maps đ to d, so "hop dong" finds "hợp đồng"
+_FTS = """
+CREATE VIRTUAL TABLE words_fts USING fts5(
+    word, meaning, meaning_folded, content='', tokenize='unicode61 remove_diacritics 2'
+);
+INSERT INTO words_fts (rowid, word, meaning, meaning_folded)
+    SELECT position, word, meaning, fold_diacritics(meaning) FROM words;
+"""
+
+
+def fts5_available():
+    connection = sqlite3.connect(':memory:')
+    try:
+        connection.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+
+
+class SqliteExport:
+    """Writes records into a fresh SQLite database as another output consumes them.
+
+    feed() wraps the record stream: every record it yields has been queued
+    for the database, so the JSON output and the database come from one
+    pass. Rows are inserted with executemany() in INSERT_BATCH batches
+    inside a single transaction; the word, topic and part-of-speech indexes
+    and the FTS5 table over word and meaning are built in a second one once
+    all rows are in (without FTS5 in the local SQLite, fts is False and the
+    table is skipped). The database is written to a temporary file and
+    moved into place by finish(), so readers never see a half-built file.
+    """
+
+    def __init__(self, path, batch=INSERT_BATCH):
+        self.path = path
+        self.temp_path = path + '.tmp'
+        self.batch = batch
+        self.count = 0
+        self.fts = fts5_available()
+        self._rows = []
+        self._stream = None
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+        self.connection = sqlite3.connect(self.temp_path, isolation_level=None)
+        # the file is rebuilt from scratch on every run, so durability is moot until finish()
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.create_function('fold_diacritics', 1, fold_diacritics, deterministic=True)
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute("BEGIN")
+
+    def _flush(self):
+        if self._rows:
+            self.connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self._rows)
+            self._rows = []
+
+    def add(self, item):
+        extra = {field: value for field, value in item.items() if field not in _COLUMN_FIELDS}
+        self._rows.append((self.count,) + tuple(item.get(field) for field, _column in WORD_COLUMNS)
+                          + (json.dumps(extra, ensure_ascii=False) if extra else None,))
+        self.count += 1
+        if len(self._rows) >= self.batch:
+            self._flush()
+
+    def _feed(self, items):
+        for item in items:
+            self.add(item)
+            yield item
+
+    def feed(self, items):
+        """Yield items unchanged, adding each to the database on the way."""
+        self._stream = self._feed(items)
+        return self._stream
+
+    def finish(self):
+        """Insert what is left of the stream, build the indexes and move the file into place.
+
+        Records the other output did not consume (or all of them, when it
+        reads the topics rather than the records) are drained here.
+        Returns a summary of the export.
+        """
+        if self._stream is not None:
+            for _item in self._stream:
+                pass
+        try:
+            self._flush()
+            self.connection.execute("COMMIT")
+            self.connection.executescript("BEGIN;" + _INDEXES + (_FTS if self.fts else "") + "COMMIT;")
+            self.connection.execute("ANALYZE")
+        finally:
+            self.connection.close()
+        os.replace(self.temp_path, self.path)
+        return {"file": self.path, "records": self.count, "fts": self.fts, "bytes": os.path.getsize(self.path)}
+
+    def abort(self):
+        self.connection.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+def write_sqlite(path, items, batch=INSERT_BATCH):
+    """Write records into a new SQLite database at path and return the export summary."""
+    export = SqliteExport(path, batch)
+    try:
+        for item in items:
+            export.add(item)
+    except BaseException:
+        export.abort()
+        raise
+    return export.finish()
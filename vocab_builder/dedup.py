@@ -0,0 +1,46 @@
+"""Merging words repeated across topics."""
+
+
+def normalize_text(text):
+    """Case- and whitespace-insensitive form used to compare words and meanings."""
+    return ' '.join(text.split()).casefold()
+
+
+def dedup_records(items):
+    """Merge tagged records that share a normalized (word, partOfSpeech).
+
+    The first occurrence keeps its position, word, pronounce, meaning and
+    category; every record gains "categories" (all its topics) and
+    "meanings" (all distinct meanings, in order of appearance). Returns
+    (records, report) where report counts the input and output records,
+    the writes saved and lists each merged group.
+    """
+    records, index, seen_meanings, copies = [], {}, [], []
+    total = 0
+    for item in items:
+        total += 1
+        key = (normalize_text(item["word"]), item["partOfSpeech"])
+        position = index.get(key)
+        if position is None:
+            index[key] = len(records)
+            merged = dict(item)
+            merged["categories"] = [item["category"]]
+            merged["meanings"] = [item["meaning"]]
+            records.append(merged)
+            seen_meanings.append({normalize_text(item["meaning"])})
+            copies.append(1)
+            continue
+        merged = records[position]
+        if item["category"] not in merged["categories"]:
+            merged["categories"].append(item["category"])
+        meaning_key = normalize_text(item["meaning"])
+        if meaning_key not in seen_meanings[position]:
+            seen_meanings[position].add(meaning_key)
+            merged["meanings"].append(item["meaning"])
+        copies[position] += 1
+
+    groups = [{"word": merged["word"], "partOfSpeech": merged["partOfSpeech"], "copies": count,
+               "categories": merged["categories"], "meanings": len(merged["meanings"])}
+              for merged, count in zip(records, copies) if count > 1]
+    report = {"input": total, "output": len(records), "writesSaved": total - len(records), "groups": groups}
+    return records, report
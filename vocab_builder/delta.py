@@ -0,0 +1,144 @@
+"""Stable record ids and patches between two builds of a deck."""
+import hashlib
+import json
+
+from .dedup import normalize_text
+from .formats import decode_dict
+
+# Bump when the patch layout changes
+PATCH_VERSION = 1
+
+# Hash bytes in a record id (16 hex digits); 64 bits keeps collisions out of
+# reach for decks far beyond 500k records
+ID_DIGEST_BYTES = 8
+
+
+def record_id(item):
+    """Content-derived id of a tagged record: a hash of its normalized word, partOfSpeech and category.
+
+    Fixing a typo in a record's pronounce or meaning keeps its id; renaming
+    the word, retagging it or moving it to another topic gives it a new one.
+    Untagged records would all collide on their word alone, so a record
+    without partOfSpeech or category raises ValueError.
+    """
+    if "partOfSpeech" not in item or "category" not in item:
+        raise ValueError(f"record {item.get('word')!r} has no id and is not tagged with partOfSpeech and category")
+    key = '\x1f'.join((normalize_text(item["word"]), item["partOfSpeech"], normalize_text(item["category"])))
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=ID_DIGEST_BYTES).hexdigest()
+
+
+def with_ids(items):
+    """Yield the records with their record_id() as a leading "id" field.
+
+    The rare record whose (word, partOfSpeech, category) repeats an earlier
+    one gets the id suffixed with its occurrence number ("-2", "-3", ...),
+    so ids stay unique and stable as long as such copies keep their order.
+    """
+    seen = {}
+    for item in items:
+        base = record_id(item)
+        copies = seen.get(base, 0) + 1
+        seen[base] = copies
+        yield {"id": base if copies == 1 else f"{base}-{copies}", **item}
+
+
+def read_records(path):
+    """Load the records of a previous build: a JSON array, NDJSON or a .dict.json file."""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.ndjson'):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    if isinstance(data, dict) and "tables" in data:
+        return decode_dict(data)
+    if not isinstance(data, list):
+        raise ValueError(f"{path} is not a deck of records")
+    return data
+
+
+def _index_by_id(items):
+    by_id = {}
+    for item in items:
+        if item["id"] in by_id:
+            raise ValueError(f"record id {item['id']!r} occurs more than once")
+        by_id[item["id"]] = item
+    return by_id
+
+
+def diff_decks(old, new):
+    """Compute the patch that turns the old deck's records into the new deck's.
+
+    Records are matched by "id"; a deck whose records have none (a build
+    made before ids existed) gets them from with_ids(), which needs tagged
+    records and raises ValueError otherwise. The patch is {"version", "records", "unchanged", "added",
+    "changed", "removed"}: added holds whole new records, changed holds
+    {"id", "set"} entries with only the fields whose value changed, plus
+    "unset" when fields were dropped, and removed lists ids. Both decks are
+    read once and matched through a dict, so the cost is linear in their size.
+    """
+    old, new = list(old), list(new)
+    if old and "id" not in old[0]:
+        old = list(with_ids(old))
+    if new and "id" not in new[0]:
+        new = list(with_ids(new))
+    remaining = _index_by_id(old)
+    added, changed = [], []
+    seen = set()
+    for item in new:
+        item_id = item["id"]
+        if item_id in seen:
+            raise ValueError(f"record id {item_id!r} occurs more than once")
+        seen.add(item_id)
+        previous = remaining.pop(item_id, None)
+        if previous is None:
+            added.append(item)
+        elif previous != item:
+            change = {"id": item_id,
+                      "set": {field: value for field, value in item.items()
+                              if field not in previous or previous[field] != value}}
+            unset = [field for field in previous if field not in item]
+            if unset:
+                change["unset"] = unset
+            changed.append(change)
+    return {
+        "version": PATCH_VERSION,
+        "records": len(new),
+        "unchanged": len(new) - len(added) - len(changed),
+        "added": added,
+        "changed": changed,
+        "removed": list(remaining),
+    }
+
+
+def apply_patch(records, patch):
+    """Apply a diff_decks() patch to the old deck's records and return the new deck's.
+
+    Records kept from the old deck stay in their order, and changed ones are
+    copied rather than modified in place; added records follow, in the new
+    deck's order. Raises
+    ValueError when the patch refers to ids the records do not have.
+    """
+    if patch.get("version") != PATCH_VERSION:
+        raise ValueError(f"unsupported patch version {patch.get('version')!r}")
+    by_id = _index_by_id(records)
+    for item_id in patch["removed"]:
+        if by_id.pop(item_id, None) is None:
+            raise ValueError(f"patch removes unknown record id {item_id!r}")
+    for change in patch["changed"]:
+        previous = by_id.get(change["id"])
+        if previous is None:
+            raise ValueError(f"patch changes unknown record id {change['id']!r}")
+        item = dict(previous)
+        item.update(change["set"])
+        for field in change.get("unset", ()):
+            del item[field]
+        by_id[change["id"]] = item
+    for item in patch["added"]:
+        if item["id"] in by_id:
+            raise ValueError(f"patch adds existing record id {item['id']!r}")
+        by_id[item["id"]] = item
+    return list(by_id.values())
+
+
+def write_patch(path, patch):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(patch, f, ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,113 @@
+"""Precomputed wrong-answer meanings for the quiz."""
+import random
+
+from .dedup import normalize_text
+from .search import _TOKEN, fold_diacritics
+
+# Wrong options per quiz question, as QuizPage.generateQuizQuestions() uses
+DEFAULT_DISTRACTORS = 3
+
+# Meanings sharing at least this share of their folded tokens (Jaccard) are
+# too close to tell apart in a quiz
+NEAR_DUPLICATE = 0.5
+
+# Candidates a record looks at in its part-of-speech group, and again in the
+# whole deck, before settling for fewer than k distractors
+SCAN_LIMIT = 64
+
+
+def meaning_tokens(meaning):
+    """The diacritic-folded tokens of a meaning, for near-duplicate checks."""
+    return frozenset(_TOKEN.findall(fold_diacritics(meaning)))
+
+
+def near_duplicate(a, b, threshold=NEAR_DUPLICATE):
+    """Whether two token sets overlap by at least threshold (Jaccard)."""
+    if not a or not b:
+        return a == b
+    shared = len(a & b)
+    return shared >= threshold * (len(a) + len(b) - shared)
+
+
+def pick_distractors(items, k=DEFAULT_DISTRACTORS, seed=0, threshold=NEAR_DUPLICATE):
+    """Choose k distractor record ids for every tagged record.
+
+    Record ids are positions in items. A record's distractors share its
+    partOfSpeech, are preferably from another category (topic), are never
+    the same word and are not near-duplicates of its meanings or of each
+    other. The deck is handled in one batch per part of speech: meaning
+    tokens are computed once per record, each group is shuffled once with
+    seed, and every record scans up to SCAN_LIMIT candidates of its group
+    from its own random start, falling back to same-topic candidates only
+    if other-topic ones run out. Records still short of k are topped up
+    from the whole deck, and keep fewer distractors if that fails too. The
+    result is a list of id lists, deterministic for a given deck and seed.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    items = list(items)
+    rng = random.Random(seed)
+    words = [normalize_text(item["word"]) for item in items]
+    categories = [item.get("category", "") for item in items]
+    tokens = [meaning_tokens(item["meaning"]) for item in items]
+    # a deduplicated record may carry several meanings; none of them may be offered as wrong
+    own_tokens = [[meaning_tokens(meaning) for meaning in item["meanings"]] if "meanings" in item else [tokens[i]]
+                  for i, item in enumerate(items)]
+    groups = {}
+    for record_id, item in enumerate(items):
+        groups.setdefault(item.get("partOfSpeech", ""), []).append(record_id)
+
+    def fits(record_id, candidate, chosen):
+        if candidate == record_id or words[candidate] == words[record_id] or candidate in chosen:
+            return False
+        candidate_tokens = tokens[candidate]
+        if any(near_duplicate(candidate_tokens, own, threshold) for own in own_tokens[record_id]):
+            return False
+        return not any(near_duplicate(candidate_tokens, tokens[other], threshold) for other in chosen)
+
+    def scan(record_id, order, start, chosen):
+        # other-topic candidates are taken as they come, same-topic ones only
+        # if the scan does not find enough of those
+        same_topic = []
+        size = len(order)
+        for step in range(min(size, SCAN_LIMIT)):
+            if len(chosen) == k:
+                return
+            candidate = order[(start + step) % size]
+            if categories[candidate] != categories[record_id]:
+                if fits(record_id, candidate, chosen):
+                    chosen.append(candidate)
+            elif len(same_topic) < k:
+                same_topic.append(candidate)
+        for candidate in same_topic:
+            if len(chosen) < k and fits(record_id, candidate, chosen):
+                chosen.append(candidate)
+
+    deck = list(range(len(items)))
+    rng.shuffle(deck)
+    picks = [None] * len(items)
+    for _pos, group in sorted(groups.items()):
+        order = group[:]
+        rng.shuffle(order)
+        starts = [rng.randrange(len(order)) for _ in order]
+        for record_id, start in zip(group, starts):
+            chosen = []
+            scan(record_id, order, start, chosen)
+            if len(chosen) < k:
+                scan(record_id, deck, rng.randrange(len(deck)), chosen)
+            picks[record_id] = chosen
+    return picks
+
+
+def add_distractors(items, k=DEFAULT_DISTRACTORS, seed=0, threshold=NEAR_DUPLICATE):
+    """Return the records with their distractors embedded.
+
+    Every record gains "distractors", the ids (positions in the returned
+    list) of its wrong options, and "distractorMeanings", their meanings, so
+    a quiz question can be built from the record alone.
+    """
+    items = list(items)
+    for item, chosen in zip(items, pick_distractors(items, k, seed, threshold)):
+        item["distractors"] = chosen
+        item["distractorMeanings"] = [items[other]["meaning"] for other in chosen]
+    return items
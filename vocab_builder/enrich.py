@@ -0,0 +1,285 @@
+"""Filling in example sentences, parts of speech and categories from a backend."""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from .dedup import normalize_text
+from .sources import _iter_lines
+
+# Record fields a backend may fill in; fields a record already has are kept
+ENRICHED_FIELDS = ("example", "partOfSpeech", "category")
+
+# Lookups in flight at once, and queued keys per worker before the producer waits
+DEFAULT_CONCURRENCY = 8
+QUEUE_PER_WORKER = 2
+
+# Attempts after the first for a lookup that failed with a transient error,
+# and the base delay of the exponential backoff between them
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_TIMEOUT = 10.0
+
+# Errors worth retrying: network trouble and timeouts
+TRANSIENT_ERRORS = (OSError, asyncio.TimeoutError)
+
+
+class CorpusBackend:
+    """Looks words up in a local example-sentence corpus.
+
+    The corpus is a TSV file of "word<TAB>partOfSpeech<TAB>example" rows;
+    blank lines and lines starting with "#" are ignored. A row with an empty
+    partOfSpeech answers for the word under any part of speech. identity
+    names the file and its content hash, so answers cached from another
+    version of the corpus are not reused.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b''):
+                digest.update(block)
+        self.identity = f"corpus:{os.path.abspath(path)}:{digest.hexdigest()}"
+        for lineno, line in enumerate(_iter_lines(path), 1):
+            if not line.strip() or line.startswith('#'):
+                continue
+            cells = line.split('\t')
+            if len(cells) != 3:
+                raise ValueError(f"{path}:{lineno}: expected word, partOfSpeech and example, got {len(cells)} cells")
+            word, pos, example = (cell.strip() for cell in cells)
+            self.entries.setdefault((normalize_text(word), pos), {"example": example})
+
+    async def lookup(self, word, pos):
+        key = normalize_text(word)
+        return self.entries.get((key, pos)) or self.entries.get((key, ""), {})
+
+
+class HttpBackend:
+    """Asks an HTTP service for GET <url>?word=...&pos=..., answered with a JSON object of fields.
+
+    A 404 means the service knows nothing about the word. Server errors are
+    raised as OSError so the caller retries them.
+    """
+
+    def __init__(self, url, timeout=DEFAULT_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+        self.identity = url
+
+    def _get(self, word, pos):
+        query = urllib.parse.urlencode({"word": word, "pos": pos})
+        separator = '&' if '?' in self.url else '?'
+        try:
+            with urllib.request.urlopen(self.url + separator + query, timeout=self.timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                return {}
+            if error.code >= 500 or error.code == 429:
+                raise OSError(f"{self.url} answered {error.code}") from error
+            raise ValueError(f"{self.url} answered {error.code} for {word!r}") from error
+
+    async def lookup(self, word, pos):
+        # urllib blocks, so each request runs on the default thread pool
+        return await asyncio.to_thread(self._get, word, pos)
+
+
+def open_backend(source, timeout=DEFAULT_TIMEOUT):
+    """HttpBackend for an http(s):// URL, CorpusBackend for anything else."""
+    if source.startswith(('http://', 'https://')):
+        return HttpBackend(source, timeout)
+    return CorpusBackend(source)
+
+
+def enrichment_key(word, pos):
+    return normalize_text(word), pos
+
+
+class EnrichmentCache:
+    """On-disk cache of backend answers keyed by (normalized word, partOfSpeech).
+
+    The file is NDJSON: a {"backend"} line naming the backend identity the
+    answers came from, then one {"word", "partOfSpeech", "fields"} line per
+    answer, appended as answers arrive, so an interrupted run keeps what it
+    fetched. Empty answers are cached too: a word the backend does not know
+    is not asked for again. Later lines win over earlier ones. A file
+    written for another identity (a switched backend or an edited corpus)
+    is ignored and overwritten by the first new answer; stale is then True.
+    Lines that do not decode, such as one cut short when a run was killed,
+    are skipped.
+    """
+
+    def __init__(self, path=None, identity=None):
+        self.path = path
+        self.identity = identity
+        self.entries = {}
+        self.stale = False
+        self._file = None
+        # answers are appended only to a file already written for this identity
+        self._append = False
+        if path is not None and os.path.exists(path):
+            lines = _iter_cache_lines(path)
+            header = next(lines, None)
+            if isinstance(header, dict) and header.get("backend", ()) == identity:
+                self._append = True
+                for entry in lines:
+                    try:
+                        self.entries[enrichment_key(entry["word"], entry["partOfSpeech"])] = entry["fields"]
+                    except (KeyError, TypeError):
+                        continue
+            else:
+                self.stale = header is not None
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, fields):
+        self.entries[key] = fields
+        if self.path is None:
+            return
+        if self._file is None:
+            if self._append:
+                self._file = open(self.path, 'a', encoding='utf-8')
+                # end a line an interrupted run left unfinished, so the next answer starts on its own
+                if self._file.tell() and not _ends_with_newline(self.path):
+                    self._file.write('\n')
+            else:
+                self._file = open(self.path, 'w', encoding='utf-8')
+                self._file.write(json.dumps({"backend": self.identity}, ensure_ascii=False) + '\n')
+        word, pos = key
+        self._file.write(json.dumps({"word": word, "partOfSpeech": pos, "fields": fields}, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _iter_cache_lines(path):
+    for line in _iter_lines(path):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _ends_with_newline(path):
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+async def _lookup_with_retries(backend, word, pos, metrics, retries, backoff, timeout):
+    for attempt in range(retries + 1):
+        try:
+            return await asyncio.wait_for(backend.lookup(word, pos), timeout)
+        except TRANSIENT_ERRORS:
+            if attempt == retries:
+                raise
+            metrics["retries"] += 1
+            # full jitter keeps retries from hitting a struggling backend in lockstep
+            await asyncio.sleep(random.uniform(0, backoff * 2 ** attempt))
+
+
+async def enrich_records_async(items, backend, cache_path=None, concurrency=DEFAULT_CONCURRENCY,
+                               retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT):
+    """Fill in example, partOfSpeech and category of tagged records from backend.
+
+    backend is any object with an async lookup(word, pos) returning a dict
+    of fields and an identity naming what it answers from (see
+    CorpusBackend and HttpBackend). Each distinct (word, partOfSpeech) is
+    looked up once: from the cache at cache_path if it has an answer from
+    the same identity, otherwise from backend by one of concurrency workers fed
+    through a bounded queue, so lookups never pile up faster than the
+    backend answers. Transient errors are retried with exponential backoff
+    and jitter; a key that still fails is reported and left out of the
+    cache, so the next run asks again. Fields a record already has keep
+    their value, and every record ends up with an "example" field. Returns
+    (records, metrics); metrics counts cache hits, backend calls, retries
+    and failures, tells whether a cache from another identity was dropped
+    (cacheStale) and lists the errors of the keys that failed.
+    """
+    started = time.perf_counter()
+    items = list(items)
+    cache = EnrichmentCache(cache_path, getattr(backend, "identity", None))
+    metrics = {"records": len(items), "keys": 0, "cacheHits": 0, "cacheStale": cache.stale, "backendCalls": 0,
+               "retries": 0, "failures": 0, "enriched": 0, "maxInFlight": 0, "seconds": 0.0, "errors": []}
+    answers = {}
+    pending = {}
+    for item in items:
+        key = enrichment_key(item["word"], item.get("partOfSpeech", ""))
+        if key in answers or key in pending:
+            continue
+        cached = cache.get(key)
+        if cached is not None:
+            answers[key] = cached
+            metrics["cacheHits"] += 1
+        else:
+            pending[key] = item["word"]
+    metrics["keys"] = len(answers) + len(pending)
+
+    in_flight = 0
+    queue = asyncio.Queue(maxsize=max(1, concurrency) * QUEUE_PER_WORKER)
+
+    async def worker():
+        nonlocal in_flight
+        while True:
+            key = await queue.get()
+            if key is None:
+                return
+            in_flight += 1
+            metrics["maxInFlight"] = max(metrics["maxInFlight"], in_flight)
+            metrics["backendCalls"] += 1
+            try:
+                fields = await _lookup_with_retries(backend, pending[key], key[1], metrics, retries, backoff, timeout)
+                if fields is None:
+                    fields = {}
+                elif not isinstance(fields, dict):
+                    raise TypeError(f"backend answered {type(fields).__name__}, not an object of fields")
+                fields = {field: value for field, value in fields.items() if field in ENRICHED_FIELDS}
+            except Exception as error:  # one bad word must not sink the whole build
+                metrics["failures"] += 1
+                metrics["errors"].append({"word": pending[key], "partOfSpeech": key[1], "error": repr(error)})
+            else:
+                answers[key] = fields
+                cache.put(key, fields)
+            finally:
+                in_flight -= 1
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(max(1, concurrency), len(pending)))]
+    try:
+        for key in pending:
+            await queue.put(key)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        cache.close()
+
+    for item in items:
+        fields = answers.get(enrichment_key(item["word"], item.get("partOfSpeech", "")), {})
+        filled = False
+        for field in ENRICHED_FIELDS:
+            if fields.get(field) and not item.get(field):
+                item[field] = fields[field]
+                filled = True
+        item.setdefault("example", "")
+        metrics["enriched"] += filled
+    metrics["seconds"] = time.perf_counter() - started
+    return items, metrics
+
+
+def enrich_records(items, backend, **options):
+    """Run enrich_records_async() to completion from synchronous code."""
+    return asyncio.run(enrich_records_async(items, backend, **options))
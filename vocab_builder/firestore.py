@@ -0,0 +1,147 @@
+"""Chunked Firestore import payload and an in-memory replay of it."""
+import json
+
+# Limits of a single Firestore writeBatch commit
+FIRESTORE_MAX_OPERATIONS = 500
+FIRESTORE_MAX_REQUEST_BYTES = 10 * 1024 * 1024
+
+# Defaults importToeicVocabulary() gives every new word
+FIRESTORE_WORD_DEFAULTS = {"status": "new", "masteryLevel": 0, "timesReviewed": 0, "timesCorrect": 0}
+
+
+def firestore_value_size(value):
+    """Storage size of a Firestore value, per the documented size rules."""
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, str):
+        return len(value.encode('utf-8')) + 1
+    if isinstance(value, dict):
+        return sum(len(key.encode('utf-8')) + 1 + firestore_value_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(firestore_value_size(item) for item in value)
+    raise TypeError(f"Unsupported Firestore value {value!r}")
+
+
+def firestore_doc_size(doc, collection="words", user_id_length=28):
+    """Estimated stored size of a word document written by addWordsInBatch().
+
+    Counts the document name (collection plus a 20-character auto id), the
+    fields, the fixed 32-byte document overhead and, unless doc already has
+    one, the userId field the app adds at write time.
+    """
+    name_size = len(collection.encode('utf-8')) + 1 + 20 + 1 + 16
+    user_id_size = 0 if "userId" in doc else len("userId") + 1 + user_id_length + 1
+    return name_size + firestore_value_size(doc) + user_id_size + 32
+
+
+def to_firestore_word(item):
+    """Map a tagged record to the Omit<VocabularyWord, "id"> shape the app stores.
+
+    The categories and meanings lists of deduplicated records and the
+    distractorMeanings of records with quiz distractors are kept.
+    """
+    doc = {
+        "word": item["word"],
+        "partOfSpeech": item.get("partOfSpeech", ""),
+        "pronunciation": item["pronounce"],
+        "category": item.get("category", ""),
+        "meaning": item["meaning"],
+        "example": item.get("example", ""),
+    }
+    for kept_field in ("categories", "meanings", "distractorMeanings"):
+        if kept_field in item:
+            doc[kept_field] = item[kept_field]
+    doc.update(FIRESTORE_WORD_DEFAULTS)
+    return doc
+
+
+def iter_firestore_chunks(items, max_operations=FIRESTORE_MAX_OPERATIONS, max_bytes=FIRESTORE_MAX_REQUEST_BYTES):
+    """Yield import-ready writeBatch chunks of at most max_operations docs.
+
+    Each chunk is {"operations", "bytes", "words"} where bytes is the summed
+    firestore_doc_size() estimate, kept at or below max_bytes.
+    """
+    if max_operations < 1:
+        raise ValueError("max_operations must be at least 1")
+    docs, size = [], 0
+    for item in items:
+        doc = to_firestore_word(item)
+        doc_size = firestore_doc_size(doc)
+        if doc_size > max_bytes:
+            raise ValueError(f"{item['word']!r} alone is larger than the {max_bytes} byte chunk limit")
+        if docs and (len(docs) == max_operations or size + doc_size > max_bytes):
+            yield {"operations": len(docs), "bytes": size, "words": docs}
+            docs, size = [], 0
+        docs.append(doc)
+        size += doc_size
+    if docs:
+        yield {"operations": len(docs), "bytes": size, "words": docs}
+
+
+def write_firestore_payload(path, items, max_operations=FIRESTORE_MAX_OPERATIONS, max_bytes=FIRESTORE_MAX_REQUEST_BYTES):
+    """Stream the chunked import payload to path and return (word_count, chunk_count)."""
+    word_count = chunk_count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        header = json.dumps({"maxOperations": max_operations, "maxBytes": max_bytes}, separators=(',', ':'))
+        f.write(header[:-1] + ',"chunks":[')
+        for chunk in iter_firestore_chunks(items, max_operations, max_bytes):
+            if chunk_count:
+                f.write(',\n')
+            f.write(json.dumps(chunk, ensure_ascii=False, separators=(',', ':')))
+            word_count += chunk["operations"]
+            chunk_count += 1
+        f.write(']}')
+    return word_count, chunk_count
+
+
+class InMemoryWriteBatch:
+    """Stand-in for a Firestore writeBatch that enforces its limits in memory."""
+
+    def __init__(self, store, max_operations=FIRESTORE_MAX_OPERATIONS, max_bytes=FIRESTORE_MAX_REQUEST_BYTES):
+        self.store = store
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.pending = []
+        self.size = 0
+        self.committed = False
+
+    def set(self, doc_id, data):
+        if self.committed:
+            raise RuntimeError("A write batch can no longer be used after commit() has been called")
+        if len(self.pending) >= self.max_operations:
+            raise RuntimeError(f"Write batch exceeds {self.max_operations} operations")
+        self.size += firestore_doc_size(data)
+        if self.size > self.max_bytes:
+            raise RuntimeError(f"Write batch exceeds {self.max_bytes} bytes")
+        self.pending.append((doc_id, data))
+
+    def commit(self):
+        self.committed = True
+        for doc_id, data in self.pending:
+            if doc_id in self.store:
+                raise RuntimeError(f"Document {doc_id} already exists")
+            self.store[doc_id] = data
+
+
+def replay_firestore_payload(path, user_id="u" * 28):
+    """Apply a payload file through InMemoryWriteBatch, like importToeicVocabulary would.
+
+    Checks each chunk's declared operation count and byte estimate against
+    what the batch actually received, and returns the resulting in-memory
+    "words" collection as {doc_id: data}.
+    """
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    store = {}
+    for number, chunk in enumerate(payload["chunks"]):
+        batch = InMemoryWriteBatch(store, payload["maxOperations"], payload["maxBytes"])
+        for index, word in enumerate(chunk["words"]):
+            batch.set(f"{number:05d}{index:015d}", dict(word, userId=user_id))
+        if len(batch.pending) != chunk["operations"]:
+            raise AssertionError(f"Chunk {number} declares {chunk['operations']} operations, has {len(batch.pending)}")
+        if batch.size != chunk["bytes"]:
+            raise AssertionError(f"Chunk {number} declares {chunk['bytes']} bytes, batch measured {batch.size}")
+        batch.commit()
+    return store
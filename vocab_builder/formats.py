@@ -0,0 +1,269 @@
+"""Alternative output formats and precompressed siblings."""
+import gzip
+import json
+import os
+import time
+
+from . import profiling
+from .pipeline import format_array_item
+
+try:
+    import brotli
+except ImportError:  # optional, only needed for .br output
+    brotli = None
+
+
+def _encode_min(item):
+    return json.dumps(item, ensure_ascii=False, separators=(',', ':'))
+
+
+def _encode_ndjson(item):
+    return json.dumps(item, ensure_ascii=False) + '\n'
+
+
+def _encode_tuple(item):
+    return json.dumps(list(item.values()), ensure_ascii=False, separators=(',', ':'))
+
+
+def _tuples_opening(item):
+    # the field list comes from the first record, as in encode_dict()
+    return '{"fields":' + json.dumps(list(item), ensure_ascii=False, separators=(',', ':')) + ',"rows":['
+
+
+# String table each dictionary-encoded field draws from
+DICT_TABLES = {
+    "word": "word",
+    "pronounce": "pronounce",
+    "meaning": "meaning",
+    "meanings": "meaning",
+    "distractorMeanings": "meaning",
+    "partOfSpeech": "partOfSpeech",
+    "category": "category",
+    "categories": "category",
+}
+
+
+def _dict_values(value):
+    return value if isinstance(value, list) else (value,)
+
+
+def encode_dict(items):
+    """Dictionary-encode records into a {"version", "fields", "tables", "rows"} document.
+
+    fields lists each record key with the string table it uses (or null),
+    in record order. Every string that occurs more than once across the
+    fields sharing a table goes into that table, most frequent first, and
+    rows hold its index instead; strings seen once stay inline. Each row is
+    the list of its record's values in field order. All records must have
+    the same keys in the same order. decode_dict() restores the records.
+    """
+    items = list(items)
+    fields = list(items[0]) if items else []
+    counts = {}
+    for item in items:
+        if list(item) != fields:
+            raise ValueError("dictionary encoding needs records with the same fields in the same order")
+        for field in fields:
+            table = DICT_TABLES.get(field)
+            if table is None:
+                continue
+            seen = counts.setdefault(table, {})
+            for value in _dict_values(item[field]):
+                if not isinstance(value, str):
+                    raise ValueError(f"dictionary-encoded field {field!r} holds a non-string value")
+                seen[value] = seen.get(value, 0) + 1
+    # sorted() is stable, so equally frequent strings keep their first-seen order
+    tables = {table: sorted((value for value, count in seen.items() if count > 1), key=seen.__getitem__, reverse=True)
+              for table, seen in counts.items()}
+    indexes = {table: {value: index for index, value in enumerate(values)} for table, values in tables.items()}
+    specs = [(field, indexes.get(DICT_TABLES.get(field))) for field in fields]
+    rows = []
+    for item in items:
+        row = []
+        for field, index in specs:
+            value = item[field]
+            if index is not None:
+                value = [index.get(element, element) for element in value] if isinstance(value, list) \
+                    else index.get(value, value)
+            row.append(value)
+        rows.append(row)
+    return {"version": 1, "fields": [[field, DICT_TABLES.get(field)] for field in fields],
+            "tables": tables, "rows": rows}
+
+
+def decode_dict(document):
+    """Restore the records of an encode_dict() document, exactly as they were encoded."""
+    tables = document["tables"]
+    names = []
+    columns = []
+    # decoded a column at a time, so each field's table lookup is one comprehension
+    for (field, table), column in zip(document["fields"], zip(*document["rows"])):
+        strings = tables.get(table, []) if table else None
+        if strings is not None:
+            column = [[strings[element] if type(element) is int else element for element in value]
+                      if type(value) is list else strings[value] if type(value) is int else value
+                      for value in column]
+        names.append(field)
+        columns.append(column)
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def _encode_dict_document(items):
+    return json.dumps(encode_dict(items), ensure_ascii=False, separators=(',', ':'))
+
+
+# name: (file suffix, opening, separator, closing, empty document, record encoder);
+# formats without an opening encode the whole record list at once, and a
+# callable opening is built from the first record, whose fields every other
+# record must then share
+OUTPUT_FORMATS = {
+    "pretty": (".json", '[\n', ',\n', '\n]', '[]', format_array_item),
+    "min": (".min.json", '[', ',', ']', '[]', _encode_min),
+    "ndjson": (".ndjson", '', '', '', '', _encode_ndjson),
+    "tuples": (".tuples.json", _tuples_opening, ',', ']}', '{"fields":[],"rows":[]}', _encode_tuple),
+    "dict": (".dict.json", None, None, None, None, _encode_dict_document),
+}
+
+COMPRESSIONS = ("gz", "br")
+
+
+class _FormatWriter:
+    """Writes one output format and its compressed siblings side by side.
+
+    Every file is written under a ".tmp" name and moved into place by
+    finish(), so a pass that fails leaves the previous outputs as they were.
+    """
+
+    def __init__(self, stem, fmt, compress):
+        self.fmt = fmt
+        self.suffix, self.opening, self.separator, self.closing, self.empty, self.encode = OUTPUT_FORMATS[fmt]
+        self.path = stem + self.suffix
+        self.count = 0
+        # a whole-document format needs every record before it can write anything
+        self.buffered = [] if self.opening is None else None
+        self.fields = None
+        self.sizes = {}
+        self.files = []
+        self.compressors = []
+        self.outputs = [self.path] + [f"{self.path}.{kind}" for kind in compress]
+        self.files.append(open(self.path + '.tmp', 'wb'))
+        for kind in compress:
+            temp_path = f"{self.path}.{kind}.tmp"
+            if kind == "gz":
+                self.compressors.append((kind, gzip.GzipFile(temp_path, 'wb', compresslevel=9, mtime=0)))
+            else:
+                self.compressors.append((kind, _BrotliFile(temp_path)))
+
+    def _write(self, text):
+        data = text.encode('utf-8')
+        self.files[0].write(data)
+        for _kind, f in self.compressors:
+            f.write(data)
+
+    def add(self, item):
+        if self.buffered is not None:
+            self.buffered.append(item)
+        elif not callable(self.opening):
+            self._write((self.separator if self.count else self.opening) + self.encode(item))
+        elif self.count:
+            if list(item) != self.fields:
+                raise ValueError(f"{self.fmt} output needs records with the same fields in the same order")
+            self._write(self.separator + self.encode(item))
+        else:
+            self.fields = list(item)
+            self._write(self.opening(item) + self.encode(item))
+        self.count += 1
+
+    def finish(self):
+        if self.buffered is not None:
+            self._write(self.encode(self.buffered))
+            self.buffered = None
+        else:
+            self._write(self.closing if self.count else self.empty)
+        self.close()
+        for path in self.outputs:
+            os.replace(path + '.tmp', path)
+        self.sizes["raw"] = os.path.getsize(self.path)
+        for kind, _f in self.compressors:
+            self.sizes[kind] = os.path.getsize(f"{self.path}.{kind}")
+
+    def close(self):
+        for f in self.files + [f for _kind, f in self.compressors]:
+            f.close()
+
+    def discard(self):
+        """Close the files and remove what was written of them."""
+        self.close()
+        for path in self.outputs:
+            if os.path.exists(path + '.tmp'):
+                os.remove(path + '.tmp')
+
+
+class _BrotliFile:
+    """Minimal streaming writer around brotli.Compressor."""
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._compressor = brotli.Compressor(quality=11)
+
+    def write(self, data):
+        self._file.write(self._compressor.process(data))
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(self._compressor.finish())
+            self._file.close()
+
+
+def parse_seconds(path, fmt):
+    """Time a client-style parse of an output file."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    start = time.perf_counter()
+    if fmt == "ndjson":
+        for line in text.splitlines():
+            json.loads(line)
+    elif fmt == "dict":
+        decode_dict(json.loads(text))
+    else:
+        json.loads(text)
+    return time.perf_counter() - start
+
+
+def write_formats(stem, items, formats=("pretty",), compress=()):
+    """Write items in every requested format in a single pass over the records.
+
+    Each format goes to stem + its suffix (".json", ".min.json", ".ndjson",
+    ".tuples.json", ".dict.json"), with ".gz"/".br" siblings for the requested compressions.
+    Returns one report per format with the file, record count, byte sizes
+    and parse time.
+    """
+    for fmt in formats:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format {fmt!r}")
+    for kind in compress:
+        if kind not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {kind!r}")
+        if kind == "br" and brotli is None:
+            raise RuntimeError("Brotli output needs the 'brotli' package (pip install brotli)")
+
+    writers = []
+    try:
+        for fmt in formats:
+            writers.append(_FormatWriter(stem, fmt, compress))
+        profile = profiling.active
+        for item in items:
+            mark = profile.begin() if profile is not None else None
+            for writer in writers:
+                writer.add(item)
+            if profile is not None:
+                profile.end("serialize", mark)
+        for writer in writers:
+            writer.finish()
+    except BaseException:
+        for writer in writers:
+            writer.discard()
+        raise
+    return [{"format": writer.fmt, "file": writer.path, "count": writer.count,
+             "bytes": writer.sizes, "parseSeconds": parse_seconds(writer.path, writer.fmt)}
+            for writer in writers]
@@ -0,0 +1,107 @@
+"""Incremental builds that only reprocess changed topics."""
+import hashlib
+import json
+import os
+
+from .pipeline import format_array_item, iter_topic_records
+from .sources import default_topics
+
+# Bump when record generation changes, so cached topic output is not reused
+CACHE_VERSION = 1
+
+
+def topic_hash(topic):
+    """Content hash of a topic block's name and source lists."""
+    _number, name, words, pronounce, meaning = topic
+    source = json.dumps([CACHE_VERSION, name, words, pronounce, meaning], ensure_ascii=False)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def manifest_path_for(json_file_path):
+    return os.path.splitext(json_file_path)[0] + '.manifest.json'
+
+
+def load_manifest(json_file_path, manifest_path):
+    """Return the previous build's manifest, or None if it can't be trusted."""
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") != CACHE_VERSION or file_hash(json_file_path) != manifest.get("outputHash"):
+            return None
+    except (OSError, ValueError):
+        return None
+    return manifest
+
+
+def build_incremental(json_file_path, topics=None, manifest_path=None):
+    """Build json_file_path, reprocessing only topics whose source changed.
+
+    The manifest records each topic's content hash and the byte span its
+    records occupy in the output. Topics with a known hash are copied from
+    the previous output as raw bytes; the rest go through the record
+    pipeline. When every hash matches, the output is left untouched.
+    Returns (item_count, rebuilt), rebuilt being the numbers of the topics
+    that were reprocessed.
+    """
+    manifest_path = manifest_path or manifest_path_for(json_file_path)
+    topics = list(default_topics() if topics is None else topics)
+    hashes = [topic_hash(topic) for topic in topics]
+    previous = load_manifest(json_file_path, manifest_path)
+    cached = {}
+    if previous is not None:
+        if [entry["hash"] for entry in previous["topics"]] == hashes:
+            return sum(entry["count"] for entry in previous["topics"]), []
+        cached = {entry["hash"]: entry for entry in previous["topics"]}
+
+    entries, rebuilt = [], []
+    offset = 2  # past the opening '[\n'
+    temp_path = json_file_path + '.tmp'
+    old = open(json_file_path, 'rb') if cached else None
+    try:
+        with open(temp_path, 'wb') as out:
+            out.write(b'[\n')
+            for topic, content_hash in zip(topics, hashes):
+                entry = cached.get(content_hash)
+                if entry is not None:
+                    old.seek(entry["offset"])
+                    chunk = old.read(entry["length"])
+                    count = entry["count"]
+                else:
+                    items = [format_array_item(item) for item in iter_topic_records(*topic[2:])]
+                    chunk = ',\n'.join(items).encode('utf-8')
+                    count = len(items)
+                    rebuilt.append(topic[0])
+                if count:
+                    if offset > 2:
+                        out.write(b',\n')
+                        offset += 2
+                    out.write(chunk)
+                entries.append({"number": topic[0], "name": topic[1], "hash": content_hash,
+                                "count": count, "offset": offset, "length": len(chunk)})
+                offset += len(chunk)
+            if offset > 2:
+                out.write(b'\n]')
+            else:
+                out.seek(0)
+                out.write(b'[]')
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    finally:
+        if old is not None:
+            old.close()
+    os.replace(temp_path, json_file_path)
+
+    manifest = {"version": CACHE_VERSION, "outputHash": file_hash(json_file_path), "topics": entries}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return sum(entry["count"] for entry in entries), rebuilt
@@ -0,0 +1,125 @@
+"""Repairing OCR-damaged IPA pronunciations."""
+import re
+
+from . import profiling
+
+# ASCII stand-ins for the length and stress marks: a typing convention, not
+# OCR damage
+IPA_STAND_INS = {':': 'ː', "'": 'ˈ', ',': 'ˌ'}
+
+# Glyphs OCR mistakes for IPA symbols: digits, Latin look-alikes, Greek and
+# Cyrillic letters, and stray capitals. None of them is an IPA symbol, so
+# any of them in a line is evidence of OCR damage
+OCR_GLYPHS = {
+    # digits
+    '0': 'θ', '1': 'ɪ', '3': 'ʒ',
+    # Latin look-alikes
+    'ı': 'ɪ', 'I': 'ɪ', 'ǝ': 'ə', 'ſ': 'ʃ', 'ş': 'ʃ', 'ğ': 'ð', 'õ': 'ð', 'ö': 'ɒ', 'A': 'ʌ',
+    # Greek
+    'Γ': 'r', 'Ι': 'ɪ', 'ι': 'ɪ', 'ρ': 'p', 'ε': 'e', 'Ζ': 'z', 'ζ': 'ʃ', 'ο': 'o', 'υ': 'ʊ',
+    # Cyrillic
+    'г': 'r', 'р': 'p', 'к': 'k', 'і': 'i',
+    # remaining capitals
+    **{letter: letter.lower() for letter in 'BCEFGHJKLMNOPQRSTUVWXYZ'},
+}
+
+# Both tables, mapped in one str.translate() pass
+IPA_GLYPHS = str.maketrans({**IPA_STAND_INS, **OCR_GLYPHS})
+
+# Multi-glyph damage, fixed before the glyph pass: "3" is ɜ when it carries
+# a length mark and ʒ otherwise
+IPA_SEQUENCES = {"3:": "ɜː", "d3": "dʒ"}
+_SEQUENCE = re.compile('|'.join(map(re.escape, sorted(IPA_SEQUENCES, key=len, reverse=True))))
+
+# Repairs that may be wrong: dz and tf are often dʒ and tʃ with their second
+# half misread, but also real clusters (/niːdz/, /aʊtfɪt/), and D is ð in
+# SAMPA as often as a misread ɒ. They are applied only to lines that show
+# other OCR damage, and flagged otherwise
+AMBIGUOUS_REPAIRS = {"dz": "dʒ", "tf": "tʃ", "D": "ɒ"}
+_AMBIGUOUS = re.compile('|'.join(map(re.escape, sorted(AMBIGUOUS_REPAIRS, key=len, reverse=True))))
+
+# Symbols an English IPA transcription may use once repaired
+IPA_SYMBOLS = frozenset("abdefghijklmnoprstuvwzæðŋθʃʒəɔɛɪʊʌɒɜɑɡɹɚɝɐˈˌː.() ")
+
+# A transcription between slashes, allowing a stray stress mark in front
+_WRAPPED = re.compile(r"\s*'?\s*/(.*)/\s*", re.DOTALL)
+
+
+def normalize_ipa(text, phrase=False):
+    """Repair one pronunciation and return (repaired, issues).
+
+    issues lists what could not be repaired: "unwrapped" (no /.../ around
+    it, returned as is), "empty", "gap" (a space where OCR lost a glyph;
+    spaces between the words of a phrase are fine; the spaces are collapsed
+    in the returned candidate), "ambiguous:<seqs>" for AMBIGUOUS_REPAIRS
+    left alone because nothing else in the line is damaged, and
+    "glyph:<chars>" for symbols that are still not IPA.
+    """
+    match = _WRAPPED.fullmatch(text)
+    if match is None:
+        return text, ("unwrapped",)
+    body = match.group(1)
+    issues = []
+    ambiguous = sorted(set(_AMBIGUOUS.findall(body)))
+    if ambiguous:
+        if set(body) - IPA_SYMBOLS - IPA_STAND_INS.keys() - AMBIGUOUS_REPAIRS.keys():
+            body = _AMBIGUOUS.sub(lambda m: AMBIGUOUS_REPAIRS[m.group()], body)
+        else:
+            issues.append("ambiguous:" + ','.join(ambiguous))
+    body = _SEQUENCE.sub(lambda m: IPA_SEQUENCES[m.group()], body).translate(IPA_GLYPHS)
+    stripped = ' '.join(body.split())
+    if not stripped:
+        return '//', ("empty",)
+    if body != body.strip() or not phrase and ' ' in stripped:
+        issues.insert(0, "gap")
+    unknown = sorted(set(stripped) - IPA_SYMBOLS)
+    if unknown:
+        issues.append("glyph:" + ''.join(unknown))
+    return f"/{stripped}/", tuple(issues)
+
+
+def normalize_pronunciations(items, cache=None):
+    """Repair the pronounce field of every record and report what is left.
+
+    Each distinct (pronounce, is-a-phrase) pair is normalized once; pass a
+    dict as cache to share that work across calls. A pronunciation flagged
+    "gap" keeps its original value, since the lost glyph cannot be guessed;
+    its repair is only reported as the candidate. Besides the issues of
+    normalize_ipa(), a pronunciation that another headword also has is
+    flagged "shared", which catches a transcription pasted onto the wrong
+    word. Returns (records, report): report counts the records, distinct
+    strings and repaired records and lists every flagged record with its
+    original pronunciation, the one written and the candidate repair.
+    """
+    items = list(items)
+    # timed after the records are pulled, so upstream stages are not counted here
+    profile = profiling.active
+    mark = profile.begin() if profile is not None else None
+    cache = {} if cache is None else cache
+    originals, candidates, issues = [], [], []
+    owners = {}
+    for item in items:
+        original = item["pronounce"]
+        key = (original, ' ' in item["word"].strip())
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = normalize_ipa(*key)
+        candidate, found = result
+        item["pronounce"] = original if "gap" in found else candidate
+        originals.append(original)
+        candidates.append(candidate)
+        issues.append(found)
+        owners.setdefault(item["pronounce"], set()).add(item["word"].casefold())
+    repaired = 0
+    flagged = []
+    for item, original, candidate, found in zip(items, originals, candidates, issues):
+        repaired += item["pronounce"] != original
+        if "unwrapped" not in found and "empty" not in found and len(owners[item["pronounce"]]) > 1:
+            found += ("shared",)
+        if found:
+            flagged.append({"word": item["word"], "original": original, "pronounce": item["pronounce"],
+                            "candidate": candidate, "issues": list(found)})
+    report = {"records": len(items), "strings": len(set(originals)), "repaired": repaired, "flagged": flagged}
+    if profile is not None:
+        profile.end("ipa", mark, len(items))
+    return items, report
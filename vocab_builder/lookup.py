@@ -0,0 +1,193 @@
+"""Binary headword lookup file, read in place through mmap."""
+import mmap
+import struct
+
+from .dedup import normalize_text
+
+LOOKUP_MAGIC = b'VOCL'
+LOOKUP_VERSION = 1
+
+# magic, version, entry count, padding to 16 bytes
+_HEADER = struct.Struct('<4sIII')
+# blob offset of the record, then byte lengths of its key, word, pronounce and meaning
+_ENTRY = struct.Struct('<IHHHH')
+# leading offset and key length of an entry, all a binary search probe needs
+_KEY_SPAN = struct.Struct('<IH')
+
+# Binary search levels whose keys a LookupFile keeps in memory once probed:
+# at most 2**FENCE_LEVELS - 1 short keys, about a megabyte at 16 levels
+FENCE_LEVELS = 16
+
+_MAX_OFFSET = 0xFFFFFFFF
+_MAX_FIELD = 0xFFFF
+
+
+def write_lookup(path, items):
+    """Write records as a lookup file and return the number of entries.
+
+    The file is a 16-byte header, a table of fixed-width entries sorted by
+    key (the normalized word, see normalize_text()) and a blob of packed
+    UTF-8 records, each its key, word, pronounce and meaning back to back.
+    Records sharing a key keep their deck order. Offsets are 32-bit and
+    field lengths 16-bit, which fits decks of several million records.
+    """
+    packed = []
+    for item in items:
+        fields = [normalize_text(item["word"]).encode('utf-8')] + \
+                 [item[field].encode('utf-8') for field in ("word", "pronounce", "meaning")]
+        if max(map(len, fields)) > _MAX_FIELD:
+            raise ValueError(f"{item['word']!r} has a field longer than {_MAX_FIELD} bytes")
+        packed.append(fields)
+    # sort() is stable, so records sharing a key keep their deck order
+    packed.sort(key=lambda fields: fields[0])
+    table = bytearray(_HEADER.pack(LOOKUP_MAGIC, LOOKUP_VERSION, len(packed), 0))
+    blob_start = _HEADER.size + _ENTRY.size * len(packed)
+    offset = blob_start
+    for fields in packed:
+        if offset > _MAX_OFFSET:
+            raise ValueError(f"lookup file would be larger than {_MAX_OFFSET} bytes")
+        table += _ENTRY.pack(offset, *map(len, fields))
+        offset += sum(map(len, fields))
+    with open(path, 'wb') as f:
+        f.write(table)
+        for fields in packed:
+            f.write(b''.join(fields))
+    return len(packed)
+
+
+class LookupEntry:
+    """One record of a LookupFile.
+
+    The *_bytes attributes are memoryviews into the mapped file, so reading
+    them copies nothing; word, pronounce and meaning decode on access.
+    """
+    __slots__ = ('word_bytes', 'pronounce_bytes', 'meaning_bytes')
+
+    def __init__(self, word_bytes, pronounce_bytes, meaning_bytes):
+        self.word_bytes = word_bytes
+        self.pronounce_bytes = pronounce_bytes
+        self.meaning_bytes = meaning_bytes
+
+    @property
+    def word(self):
+        return str(self.word_bytes, 'utf-8')
+
+    @property
+    def pronounce(self):
+        return str(self.pronounce_bytes, 'utf-8')
+
+    @property
+    def meaning(self):
+        return str(self.meaning_bytes, 'utf-8')
+
+    def to_record(self):
+        return {"word": self.word, "pronounce": self.pronounce, "meaning": self.meaning}
+
+
+class LookupFile:
+    """Read-only view of a write_lookup() file.
+
+    Opening maps the file and reads its 16-byte header, so startup costs
+    the same for any deck size. Lookups binary-search the entry table and
+    only touch the pages they read; processes that open the same file share
+    those pages through the OS page cache. The keys of the top
+    FENCE_LEVELS search levels are kept once probed, so repeated lookups
+    get faster as the process warms up. Use as a context manager, or call
+    close() when done. Entries handed out stay readable after close(); the
+    mapping is unmapped once the last of them is garbage collected.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, _padding = _HEADER.unpack_from(self._mm, 0)
+        if magic != LOOKUP_MAGIC or version != LOOKUP_VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {LOOKUP_VERSION} lookup file")
+        self._view = memoryview(self._mm)
+        self._fence = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._mm is None:
+            return
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # live entries still export slices of the mapping, which keep it
+            # alive; it is unmapped when they are collected
+            pass
+        self._mm = self._view = None
+        self._fence = {}
+
+    def _check_open(self):
+        if self._mm is None:
+            raise ValueError("lookup file is closed")
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, index):
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + _ENTRY.size * index)
+
+    def _key(self, index):
+        offset, key_length = _KEY_SPAN.unpack_from(self._mm, _HEADER.size + _ENTRY.size * index)
+        return self._mm[offset:offset + key_length]
+
+    def _record(self, index):
+        offset, key_length, word_length, pronounce_length, meaning_length = self._entry(index)
+        start = offset + key_length
+        view = self._view
+        return LookupEntry(view[start:start + word_length],
+                           view[start + word_length:start + word_length + pronounce_length],
+                           view[start + word_length + pronounce_length:
+                                start + word_length + pronounce_length + meaning_length])
+
+    def _first_at_or_after(self, key):
+        # the hot loop of every lookup, so the key probe is inlined; the keys
+        # of the first probes, which every search repeats, are cached as found
+        mm, unpack, fence = self._mm, _KEY_SPAN.unpack_from, self._fence
+        low, high, depth = 0, self._count, 0
+        while low < high:
+            middle = (low + high) >> 1
+            probe = fence.get(middle) if depth < FENCE_LEVELS else None
+            if probe is None:
+                offset, key_length = unpack(mm, _HEADER.size + _ENTRY.size * middle)
+                probe = mm[offset:offset + key_length]
+                if depth < FENCE_LEVELS:
+                    fence[middle] = probe
+            if probe < key:
+                low = middle + 1
+            else:
+                high = middle
+            depth += 1
+        return low
+
+    def get(self, word):
+        """All entries whose headword normalizes like word, in deck order; [] if none."""
+        self._check_open()
+        key = normalize_text(word).encode('utf-8')
+        index = self._first_at_or_after(key)
+        entries = []
+        while index < self._count and self._key(index) == key:
+            entries.append(self._record(index))
+            index += 1
+        return entries
+
+    def __contains__(self, word):
+        self._check_open()
+        key = normalize_text(word).encode('utf-8')
+        index = self._first_at_or_after(key)
+        return index < self._count and self._key(index) == key
+
+    def __iter__(self):
+        """Every entry, in key order."""
+        self._check_open()
+        for index in range(self._count):
+            yield self._record(index)
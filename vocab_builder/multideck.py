@@ -0,0 +1,105 @@
+"""Building several decks in one run, with their strings pooled across decks."""
+import json
+import os
+import time
+
+from .pipeline import write_json_array
+from .sources import SOURCE_FORMATS, load_topics
+from .table import StringPool, VocabularyTable
+
+# Columns compared across decks in the overlap report
+OVERLAP_FIELDS = (("word", "words"), ("pronounce", "pronounces"), ("meaning", "meanings"))
+
+
+def deck_name(source):
+    """Name of a deck and of its output file, e.g. "toeic_600" for data/toeic_600.tsv."""
+    return os.path.splitext(os.path.basename(source))[0]
+
+
+def _build_deck_file(job):
+    """Build one deck's JSON output and return its summary and column table."""
+    source, output = job
+    started = time.perf_counter()
+    # the table's records are the build command's records, so the source is parsed once
+    table = VocabularyTable.from_topics(load_topics(source), StringPool())
+    with open(output, 'w', encoding='utf-8') as f:
+        count = write_json_array(table.to_records(), f)
+    # ship the pool without its lookup index; the parent re-interns by id anyway
+    table.pool.compact()
+    summary = {"name": deck_name(source), "source": source, "output": output, "records": count,
+               "seconds": time.perf_counter() - started}
+    return summary, table
+
+
+def build_decks(sources, out_dir, workers=None, pool=None):
+    """Build every source deck into out_dir and report how much they overlap.
+
+    Decks are scheduled largest file first across a process pool of workers
+    (one per CPU by default), so the run takes about as long as the slowest
+    deck. Each worker writes <name>.json exactly as the build command would
+    and sends back the deck as a VocabularyTable; the tables are re-interned
+    into pool (a new StringPool by default), so strings that several decks
+    share are held once. Returns (tables, report): tables maps deck names to
+    their pooled tables, report lists every deck and, per field, how many
+    distinct strings the decks have, how many of those occur in more than
+    one deck, and how many headwords each pair of decks shares.
+    """
+    sources = list(sources)
+    for source in sources:
+        # checked before any worker starts, so one bad path fails the run cleanly
+        if not os.path.isfile(source):
+            raise ValueError(f"no such deck source {source!r}")
+        if os.path.splitext(source)[1].lower() not in SOURCE_FORMATS:
+            raise ValueError(f"Unsupported topic file {source!r}, expected one of {', '.join(SOURCE_FORMATS)}")
+    names = [deck_name(source) for source in sources]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"decks would overwrite each other's output: {', '.join(duplicates)}")
+    os.makedirs(out_dir, exist_ok=True)
+    started = time.perf_counter()
+    jobs = sorted(((source, os.path.join(out_dir, name + '.json')) for source, name in zip(sources, names)),
+                  key=lambda job: os.path.getsize(job[0]), reverse=True)
+    pool = StringPool() if pool is None else pool
+    by_name = {}
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # tables are re-interned as they arrive, while later decks still build
+            for summary, table in executor.map(_build_deck_file, jobs):
+                by_name[summary["name"]] = summary, table.reintern(pool)
+    else:
+        for summary, table in map(_build_deck_file, jobs):
+            by_name[summary["name"]] = summary, table.reintern(pool)
+    tables = {name: by_name[name][1] for name in names}
+    report = {
+        "decks": [by_name[name][0] for name in names],
+        "seconds": time.perf_counter() - started,
+        "pooledStrings": len(pool),
+        "fields": {},
+        "sharedHeadwords": {},
+    }
+    for field, column in OVERLAP_FIELDS:
+        decks_per_string = {}
+        deck_strings = 0
+        for table in tables.values():
+            distinct = set(getattr(table, column))
+            deck_strings += len(distinct)
+            for string_id in distinct:
+                decks_per_string[string_id] = decks_per_string.get(string_id, 0) + 1
+        report["fields"][field] = {
+            "distinct": len(decks_per_string),
+            "perDeckTotal": deck_strings,
+            "inSeveralDecks": sum(1 for decks in decks_per_string.values() if decks > 1),
+        }
+    headwords = {name: set(table.words) for name, table in tables.items()}
+    for position, name in enumerate(names):
+        report["sharedHeadwords"][name] = {other: len(headwords[name] & headwords[other])
+                                           for other in names[position + 1:]}
+    return tables, report
+
+
+def write_overlap_report(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
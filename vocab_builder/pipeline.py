@@ -0,0 +1,184 @@
+"""The build pipeline: topic blocks in, vocabulary records and JSON out."""
+import json
+import re
+
+from . import profiling
+from .sources import default_topics, load_topics
+
+# Source part-of-speech tags, e.g. "agreement (n)", and the names the app
+# uses in its partOfSpeech field
+POS_NAMES = {"n": "noun", "v": "verb", "adj": "adjective", "adv": "adverb"}
+
+# One source word per line: group 1 is the text before a trailing "(...)"
+# tag and group 2 the tag, or group 3 the whole line when it has no trailing
+# tag. Only the last parenthesis counts as the tag, as in the old per-word
+# re.sub(), so "(be) responsible (adj)" and "check (in) (v)" parse. Used by
+# parse_pos_batch().
+POS_LINE = re.compile(r'^(?:([^\n]*)\(([^()\n]*)\)|([^\n]*))[ \t]*$', re.M)
+
+# POS_LINE for a single word that may contain line breaks (CSV and NDJSON
+# sources allow them), used with fullmatch()
+POS_WORD = re.compile(r'(?:(.*)\(([^()\n]*)\)|(.*))[ \t]*', re.S)
+
+
+def parse_pos_batch(words):
+    """Split a list of "word (pos)" strings into headwords and POS names.
+
+    The whole list is scanned in a single POS_LINE pass, or word by word
+    with POS_WORD when a word contains a line break. Returns
+    (cleaned, pos, issues): cleaned is what stripping a trailing
+    "(n|v|adj|adv)" tag and surrounding whitespace gives for each word, pos
+    holds "noun"/"verb"/"adjective"/"adverb" or "" when no valid tag was
+    found, and issues lists (index, word, reason) for every word whose tag
+    is missing, unknown or malformed.
+    """
+    if not words:
+        return [], [], []
+    text = '\n'.join(words)
+    if text.count('\n') == len(words) - 1:
+        matches = POS_LINE.findall(text)
+    else:
+        # a word with a line break would span several lines of the batch
+        matches = [POS_WORD.fullmatch(word).groups('') for word in words]
+    cleaned, pos, issues = [], [], []
+    add_word, add_pos, names = cleaned.append, pos.append, POS_NAMES
+    for index, (head, tag, untagged) in enumerate(matches):
+        name = names.get(tag)
+        if name is not None:
+            add_word(head.strip())
+            add_pos(name)
+            continue
+        word = words[index].strip()
+        add_word(word)
+        add_pos("")
+        if untagged.count('(') != untagged.count(')'):
+            reason = "malformed tag"
+        elif tag:
+            reason = f"unknown tag ({tag})"
+        else:
+            reason = "missing tag"
+        issues.append((index, words[index], reason))
+    return cleaned, pos, issues
+
+
+def iter_topic_records(words, pronounce, meaning, category=None):
+    """Yield the vocabulary records of one topic block, one at a time.
+
+    With a category, records also carry the "partOfSpeech" and "category"
+    fields of the app's vocabulary asset.
+    """
+    profile = profiling.active
+    if profile is not None:
+        yield from _iter_topic_records_profiled(profile, words, pronounce, meaning, category)
+        return
+    cleaned, pos, _issues = parse_pos_batch(words)
+    for i in range(len(words)):
+        record = {
+            "word": cleaned[i],
+            "pronounce": pronounce[i],
+            "meaning": meaning[i]
+        }
+        if category is not None:
+            record["partOfSpeech"] = pos[i]
+            record["category"] = category
+        yield record
+
+
+def _iter_topic_records_profiled(profile, words, pronounce, meaning, category):
+    mark = profile.begin()
+    cleaned, pos, _issues = parse_pos_batch(words)
+    profile.end("pos", mark)
+    mark = profile.begin()
+    records = [{"word": cleaned[i], "pronounce": pronounce[i], "meaning": meaning[i]} for i in range(len(words))]
+    if category is not None:
+        for i, record in enumerate(records):
+            record["partOfSpeech"] = pos[i]
+            record["category"] = category
+    profile.end("assemble", mark)
+    yield from records
+
+
+def iter_vocabulary_items(topics=None, tagged=False):
+    """Yield the records of every topic block, in source order.
+
+    topics defaults to the TOEIC 600 deck. tagged adds each record's
+    partOfSpeech and its topic name as category.
+    """
+    if topics is None:
+        topics = default_topics()
+    profile = profiling.active
+    if profile is not None:
+        yield from _iter_vocabulary_items_profiled(profile, topics, tagged)
+        return
+    for _number, name, words, pronounce, meaning in topics:
+        yield from iter_topic_records(words, pronounce, meaning, name if tagged else None)
+
+
+def _iter_vocabulary_items_profiled(profile, topics, tagged):
+    topics = iter(topics)
+    while True:
+        # topics may be a lazy loader, so pulling the next block is the load stage
+        mark = profile.begin()
+        topic = next(topics, None)
+        profile.end("load", mark)
+        if topic is None:
+            return
+        number, name, words, pronounce, meaning = topic
+        profile.count_topic(number, name, len(words))
+        yield from iter_topic_records(words, pronounce, meaning, name if tagged else None)
+
+
+def build_deck(source=None, tagged=False, dedup=False):
+    """Return the vocabulary records of a topic source file, without writing anything.
+
+    source is a .tsv/.csv/.ndjson path, or None for the TOEIC 600 deck.
+    Records are yielded lazily as the file is read. dedup merges words
+    repeated across topics (see dedup_records()), which implies tagged and
+    returns the merged records as a list.
+    """
+    topics = None if source is None else load_topics(source)
+    if not dedup:
+        return iter_vocabulary_items(topics, tagged)
+    from .dedup import dedup_records
+
+    records, _report = dedup_records(iter_vocabulary_items(topics, tagged=True))
+    return records
+
+
+def write_json_array(items, f, indent=4):
+    """Stream records into f as a JSON array and return how many were written.
+
+    Each record is serialized and flushed on its own, so memory does not grow
+    with the deck. The output is identical to
+    json.dump(list(items), f, ensure_ascii=False, indent=indent).
+    """
+    profile = profiling.active
+    if profile is not None:
+        return _write_json_array_profiled(profile, items, f, indent)
+    count = 0
+    for item in items:
+        f.write('[\n' if count == 0 else ',\n')
+        f.write(format_array_item(item, indent))
+        count += 1
+    f.write('\n]' if count else '[]')
+    return count
+
+
+def _write_json_array_profiled(profile, items, f, indent):
+    count = 0
+    for item in items:
+        mark = profile.begin()
+        f.write('[\n' if count == 0 else ',\n')
+        f.write(format_array_item(item, indent))
+        profile.end("serialize", mark)
+        count += 1
+    f.write('\n]' if count else '[]')
+    return count
+
+
+def format_array_item(item, indent=4):
+    """Serialize one record the way json.dump(..., indent=indent) nests it in an array."""
+    pad = ' ' * indent
+    # json.dumps escapes newlines inside strings, so every raw newline here is
+    # structural and only needs the outer array's indentation.
+    return pad + json.dumps(item, ensure_ascii=False, indent=indent).replace('\n', '\n' + pad)
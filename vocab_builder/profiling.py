@@ -0,0 +1,85 @@
+"""Per-stage build profiling, switched on by start_profile()."""
+import sys
+import time
+
+
+class BuildProfile:
+    """Per-stage timers, allocation counters and per-topic record counts.
+
+    Hooks in the pipeline only call into this while a profile is active (see
+    start_profile()); otherwise they cost one global lookup per topic or
+    per output file. Memory is traced with tracemalloc and, if requested, the
+    whole run is captured with cProfile.
+    """
+
+    def __init__(self, trace_memory=True, cprofile=False):
+        self.stages = {}
+        self.topics = []
+        self.trace_memory = trace_memory
+        self.profiler = None
+        self.started = time.perf_counter()
+        if trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        if cprofile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    @staticmethod
+    def begin():
+        return time.perf_counter(), sys.getallocatedblocks()
+
+    def end(self, stage, mark, calls=1):
+        seconds, blocks = mark
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = {"seconds": 0.0, "calls": 0, "allocatedBlocks": 0}
+        totals["seconds"] += time.perf_counter() - seconds
+        totals["calls"] += calls
+        totals["allocatedBlocks"] += sys.getallocatedblocks() - blocks
+
+    def count_topic(self, number, name, records):
+        self.topics.append({"topic": number, "name": name, "records": records})
+
+    def finish(self, cprofile_path=None, top=25):
+        """Stop tracing and return the stats report as a dict."""
+        report = {"totalSeconds": time.perf_counter() - self.started,
+                  "records": sum(topic["records"] for topic in self.topics),
+                  "stages": self.stages, "topics": self.topics}
+        if self.trace_memory:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report["memory"] = {"currentBytes": current, "peakBytes": peak}
+        if self.profiler is not None:
+            import pstats
+            self.profiler.disable()
+            stats = pstats.Stats(self.profiler)
+            if cprofile_path:
+                stats.dump_stats(cprofile_path)
+            rows = sorted(stats.stats.items(), key=lambda row: row[1][3], reverse=True)[:top]
+            report["cprofile"] = {
+                "file": cprofile_path,
+                "top": [{"function": f"{path}:{line}({function})", "calls": calls,
+                         "totalSeconds": total, "cumulativeSeconds": cumulative}
+                        for (path, line, function), (_prim, calls, total, cumulative, _callers) in rows],
+            }
+        return report
+
+
+# The active BuildProfile, or None when profiling is off
+active = None
+
+
+def start_profile(trace_memory=True, cprofile=False):
+    global active
+    active = BuildProfile(trace_memory, cprofile)
+    return active
+
+
+def stop_profile(cprofile_path=None):
+    """Finish the active profile and return its report."""
+    global active
+    profile, active = active, None
+    return profile.finish(cprofile_path)
@@ -0,0 +1,125 @@
+"""Prebuilt search index over words and meanings."""
+import json
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+# "đ" has no decomposition, so NFD alone would leave it in folded text
+_FOLD_EXTRA = str.maketrans({"đ": "d", "Đ": "d"})
+_TOKEN = re.compile(r"\w+")
+
+
+def fold_diacritics(text):
+    """Lowercase text and strip its accents, e.g. "Hợp đồng" -> "hop dong"."""
+    decomposed = unicodedata.normalize('NFD', text.translate(_FOLD_EXTRA).lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def build_search_index(items, prefix_length=6):
+    """Build posting lists over the English words and Vietnamese meanings.
+
+    Record ids are positions in items. "prefix" maps every lowercased word
+    prefix up to prefix_length characters, "trigram" every trigram of the
+    lowercased word and "meaning" every diacritic-folded meaning token to
+    the sorted ids containing it.
+    """
+    prefix, trigram, meaning = {}, {}, {}
+    count = 0
+    for record_id, item in enumerate(items):
+        word = item["word"].lower()
+        for key in {word[:length] for length in range(1, min(prefix_length, len(word)) + 1)}:
+            prefix.setdefault(key, []).append(record_id)
+        for key in trigrams(word):
+            trigram.setdefault(key, []).append(record_id)
+        for key in set(_TOKEN.findall(fold_diacritics(item["meaning"]))):
+            meaning.setdefault(key, []).append(record_id)
+        count = record_id + 1
+    # ids are appended in increasing order, so every posting list is sorted
+    return {"version": 1, "count": count, "prefixLength": prefix_length,
+            "prefix": prefix, "trigram": trigram, "meaning": meaning}
+
+
+def write_search_index(path, items, prefix_length=6):
+    index = build_search_index(items, prefix_length)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    return index
+
+
+def intersect_sorted(postings):
+    """Intersect sorted id lists, shortest first.
+
+    Lists of similar length are intersected as sets; a much longer list is
+    probed by binary search instead, so its length barely matters.
+    """
+    if not postings:
+        return []
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        if not result:
+            break
+        if len(other) < 32 * len(result):
+            result = sorted(set(result).intersection(other))
+            continue
+        found, start, end = [], 0, len(other)
+        for record_id in result:
+            start = bisect_left(other, record_id, start, end)
+            if start == end:
+                break
+            if other[start] == record_id:
+                found.append(record_id)
+        result = found
+    return list(result)
+
+
+class SearchIndex:
+    """Lookups over an index from build_search_index() or its JSON file.
+
+    Posting lists are held as array('I'). With the deck's words, matches
+    from trigram candidates are verified against the actual headword.
+    """
+
+    def __init__(self, index, words=None):
+        self.prefix_length = index["prefixLength"]
+        self.prefix = {key: array('I', ids) for key, ids in index["prefix"].items()}
+        self.trigram = {key: array('I', ids) for key, ids in index["trigram"].items()}
+        self.meaning = {key: array('I', ids) for key, ids in index["meaning"].items()}
+        self.words = [word.lower() for word in words] if words is not None else None
+
+    @classmethod
+    def load(cls, path, words=None):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f), words)
+
+    def search_word(self, query):
+        """Ids of words starting with query."""
+        query = query.lower()
+        if len(query) <= self.prefix_length:
+            return list(self.prefix.get(query, ()))
+        postings = [self.prefix.get(query[:self.prefix_length], ())]
+        postings.extend(self.trigram.get(key, ()) for key in trigrams(query))
+        candidates = intersect_sorted(postings)
+        if self.words is None:
+            return candidates
+        return [record_id for record_id in candidates if self.words[record_id].startswith(query)]
+
+    def search_substring(self, query):
+        """Ids of words containing query; needs at least three characters."""
+        query = query.lower()
+        if len(query) < 3:
+            raise ValueError("substring queries need at least three characters")
+        candidates = intersect_sorted([self.trigram.get(key, ()) for key in trigrams(query)])
+        if self.words is None:
+            return candidates
+        return [record_id for record_id in candidates if query in self.words[record_id]]
+
+    def search_meaning(self, query):
+        """Ids of meanings containing every token of query, accents ignored."""
+        tokens = set(_TOKEN.findall(fold_diacritics(query)))
+        return intersect_sorted([self.meaning.get(token, ()) for token in tokens])
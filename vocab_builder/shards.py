@@ -0,0 +1,67 @@
+"""Sharded output: one JSON file per topic plus an index."""
+import hashlib
+import io
+import json
+import os
+import re
+
+from .pipeline import iter_topic_records, write_json_array
+from .sources import default_topics
+
+
+def shard_file_name(number, name, width=2):
+    """File name of a topic's shard, e.g. "topic-01-contracts.json"."""
+    slug = re.sub(r"[^a-z0-9]+", '-', re.sub(r"['\u2019]", '', name.lower())).strip('-')
+    return f"topic-{number:0{width}d}-{slug}.json"
+
+
+def remove_stale_files(out_dir, index_path, list_key, current):
+    """Remove the files a previous index in out_dir lists under list_key that are not in current.
+
+    Only bare file names are honoured, so a tampered index cannot reach
+    outside out_dir; a missing or unreadable index removes nothing.
+    """
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            previous = json.load(f).get(list_key, [])
+    except (OSError, ValueError, AttributeError):
+        previous = []
+    for entry in previous:
+        stale = entry.get("file")
+        if stale and stale not in current and os.path.basename(stale) == stale:
+            path = os.path.join(out_dir, stale)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def write_shards(out_dir, topics=None, index_name='index.json'):
+    """Write one JSON array per topic into out_dir, plus an index manifest.
+
+    The index lists every shard's topic, file name, word count, size in
+    bytes and sha256, so clients can fetch just the topics they need and
+    cache shards by hash. Shards listed by a previous index that are no
+    longer produced are removed. Returns the index as a dict.
+    """
+    topics = list(default_topics() if topics is None else topics)
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, index_name)
+    width = max(2, len(str(max((topic[0] for topic in topics), default=0))))
+    shards = []
+    for number, name, words, pronounce, meaning in topics:
+        buffer = io.StringIO()
+        count = write_json_array(iter_topic_records(words, pronounce, meaning), buffer)
+        data = buffer.getvalue().encode('utf-8')
+        file_name = shard_file_name(number, name, width)
+        with open(os.path.join(out_dir, file_name), 'wb') as f:
+            f.write(data)
+        shards.append({"topic": number, "name": name, "file": file_name, "wordCount": count,
+                       "bytes": len(data), "hash": hashlib.sha256(data).hexdigest()})
+
+    remove_stale_files(out_dir, index_path, "shards", {shard["file"] for shard in shards})
+
+    index = {"wordCount": sum(shard["wordCount"] for shard in shards),
+             "bytes": sum(shard["bytes"] for shard in shards),
+             "shards": shards}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    return index
@@ -0,0 +1,157 @@
+"""Spaced-repetition load simulation, for sizing Firestore quotas."""
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:  # optional, only needed for the load simulation
+    np = None
+
+# Review schedule of src/utils/spacedRepetition.ts: days until the next
+# review by mastery level, scaled by how the last review went
+BASE_INTERVALS = (0, 1, 3, 7, 14, 30)
+EASE_FACTOR = {"difficult": 0.6, "ok": 1.0, "easy": 1.5}
+PERFORMANCES = ("difficult", "ok", "easy")
+MAX_MASTERY = len(BASE_INTERVALS) - 1
+
+# Firestore operations of one flashcard review (updateWordMasteryWithPerformance:
+# getDoc of the word, updateDoc of the word and of the user) and of one study
+# session besides loading the learner's words (updateUserStudyStats)
+REVIEW_READS, REVIEW_WRITES = 1, 2
+SESSION_READS, SESSION_WRITES = 1, 1
+
+# Resolution of the random draw behind each group of reviews, and the group
+# size from which the outcome is drawn with binomials instead of a table
+_DRAWS = 1 << 16
+_TABLE_GROUPS = 32
+
+
+def next_mastery(level, performance):
+    """Mastery level after a review, as updateWordMasteryWithPerformance sets it."""
+    if performance == "difficult":
+        return max(0, level - 1)
+    if performance == "ok":
+        return min(MAX_MASTERY, level + 1)
+    return MAX_MASTERY
+
+
+def review_interval(level, performance):
+    """Days until the next review, like calculateNextReviewDate(level, performance)."""
+    days = BASE_INTERVALS[level] * EASE_FACTOR[performance]
+    return int(days + 0.5)  # Math.round
+
+
+def _outcome_table(weights, largest):
+    """Inverse CDF of a review group's outcome, for group sizes below largest.
+
+    Row n maps a 16-bit draw to difficult | easy << 8, the number of
+    "difficult" and "easy" results among n reviews, following the
+    multinomial distribution of the weights.
+    """
+    pd, pok, pe = (weight / sum(weights) for weight in weights)
+    slots = np.arange(_DRAWS) + 0.5
+    table = np.zeros((largest, _DRAWS), dtype=np.uint16)
+    for n in range(1, largest):
+        outcomes, cdf, total = [], [], 0.0
+        for difficult in range(n + 1):
+            for easy in range(n - difficult + 1):
+                total += (math.comb(n, difficult) * math.comb(n - difficult, easy)
+                          * pd ** difficult * pe ** easy * pok ** (n - difficult - easy))
+                outcomes.append(difficult | easy << 8)
+                cdf.append(total)
+        picks = np.searchsorted(np.array(cdf) / total * _DRAWS, slots).clip(0, len(outcomes) - 1)
+        table[n] = np.array(outcomes, dtype=np.uint16)[picks]
+    return table
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("The load simulation needs the 'numpy' package (pip install numpy)")
+
+
+def simulate_reviews(words, users=1000, days=365, new_per_day=12, active_rate=0.7,
+                     performance=(0.2, 0.6, 0.2), seed=0):
+    """Project the daily Firestore load of a cohort of learners studying a deck.
+
+    Every learner gets the words deck imported on day 0. On each day a
+    learner is active with probability active_rate; an active learner opens
+    one study session, reviews every word that is due and starts up to
+    new_per_day unseen words. Each review draws "difficult", "ok" or "easy"
+    with the given weights and reschedules the word with next_mastery() and
+    review_interval(). Words due on a day their learner is inactive stay due,
+    and a word due again the same day is reviewed the next one.
+
+    The rules treat all words alike, so a learner's state is how many of
+    their words sit at each mastery level and fall due on each day. That
+    state is one (day, level, learner) array for the whole cohort, and a day
+    of reviews is a fixed number of array operations over all learners and
+    words at once, with one random draw per (level, learner) group of
+    reviews. Returns a report with the daily reviews, new words, sessions,
+    reads and writes, their totals and the peak day.
+    """
+    _require_numpy()
+    weights = [float(weight) for weight in performance]
+    if len(weights) != len(PERFORMANCES) or min(weights) < 0 or not sum(weights):
+        raise ValueError("performance must be three non-negative weights for difficult, ok and easy")
+    if min(words, users, days, new_per_day) < 0 or not 0 <= active_rate <= 1:
+        raise ValueError("words, users, days and new_per_day must not be negative, active_rate must be in [0, 1]")
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    levels = MAX_MASTERY + 1
+    table = _outcome_table(weights, _TABLE_GROUPS).ravel()
+    pd, pe = weights[0] / sum(weights), weights[2] / sum(weights)
+    pe_rest = min(1.0, pe / (1 - pd)) if pd < 1 else 0.0
+    moves = [[(next_mastery(level, name), max(1, review_interval(next_mastery(level, name), name)))
+              for name in PERFORMANCES] for level in range(levels)]
+
+    # due[day % horizon, level, learner]: words due that day at that level
+    horizon = max(interval for row in moves for _level, interval in row) + 1
+    due = np.zeros((horizon, levels, users), dtype=np.int32)
+    introduced = np.zeros(users, dtype=np.int32)
+    daily = {key: np.zeros(days, dtype=np.int64) for key in ("reviews", "newWords", "sessions")}
+    for day in range(days):
+        today = due[day % horizon]
+        active = rng.random(users) < active_rate
+        counts = today * active
+        due[(day + 1) % horizon] += today - counts
+        today.fill(0)
+        fresh = np.minimum(new_per_day, words - introduced) * active
+        introduced += fresh
+        counts[0] += fresh
+
+        # One draw per (level, learner) group of reviews, looked up in the
+        # outcome table; the rare larger groups use two binomials instead
+        sizes = counts.ravel()
+        slots = np.minimum(sizes, _TABLE_GROUPS - 1)
+        slots <<= 16
+        slots |= rng.integers(0, _DRAWS, len(sizes), dtype=np.uint16)
+        drawn = np.take(table, slots)
+        difficult = drawn & 0xff
+        easy = drawn >> 8
+        large = np.flatnonzero(sizes >= _TABLE_GROUPS)
+        if len(large):
+            difficult[large] = rng.binomial(sizes[large], pd)
+            easy[large] = rng.binomial(sizes[large] - difficult[large], pe_rest)
+        difficult = difficult.reshape(levels, users)
+        easy = easy.reshape(levels, users)
+        ok = counts - difficult - easy
+        for level in range(levels):
+            for got, (target, interval) in zip((difficult, ok, easy), moves[level]):
+                due[(day + interval) % horizon, target] += got[level]
+
+        daily["reviews"][day] = sizes.sum()
+        daily["newWords"][day] = fresh.sum()
+        daily["sessions"][day] = np.count_nonzero(active)
+
+    # each session loads all of the learner's words (getAllWords)
+    daily["reads"] = daily["reviews"] * REVIEW_READS + daily["sessions"] * (words + SESSION_READS)
+    daily["writes"] = daily["reviews"] * REVIEW_WRITES + daily["sessions"] * SESSION_WRITES
+    peak = int(np.argmax(daily["reads"] + daily["writes"])) if days else 0
+    return {
+        "users": users, "words": words, "days": days, "newPerDay": new_per_day,
+        "activeRate": active_rate, "performance": dict(zip(PERFORMANCES, weights)), "seed": seed,
+        "seconds": time.perf_counter() - started,
+        "totals": {key: int(values.sum()) for key, values in daily.items()},
+        "peak": {"day": peak, **{key: int(values[peak]) for key, values in daily.items()}} if days else None,
+        "daily": {key: values.tolist() for key, values in daily.items()},
+    }
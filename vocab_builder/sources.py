@@ -0,0 +1,223 @@
+"""Topic source files: loading and writing TSV, CSV and NDJSON decks."""
+import csv
+import json
+import mmap
+import os
+import re
+
+# Topic blocks are (number, name, words, pronounce, meaning) tuples; the
+# three lists of a block are parallel and paired up by index.
+DEFAULT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'toeic_600.tsv')
+
+# Section header of a topic in TSV/CSV source files
+TOPIC_HEADER = re.compile(r'^#\s*---\s*Topic\s+(\d+)\.\s*(.*?)\s*---\s*$')
+
+
+def _iter_lines(path, keepends=False):
+    """Yield the decoded lines of a file, read lazily through mmap."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first = True
+            for raw in iter(mm.readline, b''):
+                line = raw.decode('utf-8')
+                if first:
+                    line = line.lstrip('\ufeff')
+                    first = False
+                yield line if keepends else line.rstrip('\r\n')
+
+
+def _row_outside_topic(path, lineno):
+    return ValueError(f"{path}:{lineno}: row before the first topic header")
+
+
+def _add_ragged(block, fields):
+    # field i goes to list i, surplus fields to the meanings, so a bad row
+    # leaves the block's lists with different lengths
+    for column, value in zip((2, 3, 4), fields):
+        block[column].append(value)
+    block[4].extend(fields[3:])
+
+
+def iter_tsv_topics(path, strict=True):
+    """Yield topic blocks from a TSV file of "word (pos)<TAB>pronounce<TAB>meaning" rows.
+
+    Each topic starts with a "# --- Topic N. Name ---" line; other lines
+    starting with "#" and blank lines are ignored. A row without exactly
+    three fields raises ValueError, or with strict=False is added as far as
+    it goes, leaving a ragged block for validate_topic() to report.
+    """
+    current = None
+    for lineno, line in enumerate(_iter_lines(path), 1):
+        if not line.strip():
+            continue
+        if line.startswith('#'):
+            header = TOPIC_HEADER.match(line)
+            if header:
+                if current is not None:
+                    yield current
+                current = (int(header.group(1)), header.group(2), [], [], [])
+                add_word, add_pronounce, add_meaning = current[2].append, current[3].append, current[4].append
+            continue
+        fields = line.split('\t')
+        if len(fields) != 3:
+            if strict:
+                raise ValueError(f"{path}:{lineno}: expected 3 tab-separated fields, got {len(fields)}")
+            if current is None:
+                raise _row_outside_topic(path, lineno)
+            _add_ragged(current, fields)
+            continue
+        if current is None:
+            raise _row_outside_topic(path, lineno)
+        add_word(fields[0])
+        add_pronounce(fields[1])
+        add_meaning(fields[2])
+    if current is not None:
+        yield current
+
+
+def iter_csv_topics(path, strict=True):
+    """Yield topic blocks from a CSV file laid out like the TSV source (strict as for iter_tsv_topics())."""
+    def lines():
+        for line in _iter_lines(path, keepends=True):
+            if line.startswith('#'):
+                # quote comment and header lines into one field so the commas
+                # in topic names don't split them
+                line = '"' + line.rstrip('\r\n').replace('"', '""') + '"\n'
+            yield line
+
+    current = None
+    reader = csv.reader(lines())
+    for fields in reader:
+        if not fields or (len(fields) == 1 and not fields[0].strip()):
+            continue
+        if len(fields) == 1 and fields[0].startswith('#'):
+            header = TOPIC_HEADER.match(fields[0])
+            if header:
+                if current is not None:
+                    yield current
+                current = (int(header.group(1)), header.group(2), [], [], [])
+            continue
+        if current is None:
+            raise _row_outside_topic(path, reader.line_num)
+        if len(fields) != 3:
+            if strict:
+                raise ValueError(f"{path}:{reader.line_num}: expected 3 fields, got {len(fields)}")
+            _add_ragged(current, fields)
+            continue
+        current[2].append(fields[0])
+        current[3].append(fields[1])
+        current[4].append(fields[2])
+    if current is not None:
+        yield current
+
+
+def iter_ndjson_topics(path, strict=True):
+    """Yield topic blocks from NDJSON with {"topic", "name"} header objects
+    followed by {"word", "pronounce", "meaning"} rows.
+
+    A row missing one of its fields raises ValueError, or with strict=False
+    adds the fields it has, leaving a ragged block.
+    """
+    current = None
+    for lineno, line in enumerate(_iter_lines(path), 1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if "topic" in row:
+            if current is not None:
+                yield current
+            current = (row["topic"], row["name"], [], [], [])
+            continue
+        if current is None:
+            raise _row_outside_topic(path, lineno)
+        missing = [field for field in ("word", "pronounce", "meaning") if field not in row]
+        if missing and strict:
+            raise ValueError(f"{path}:{lineno}: row has no {', '.join(missing)}")
+        for column, field in ((2, "word"), (3, "pronounce"), (4, "meaning")):
+            if field in row:
+                current[column].append(row[field])
+    if current is not None:
+        yield current
+
+
+def write_tsv_topics(path, topics):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for number, name, words, pronounce, meaning in topics:
+            f.write(f"# --- Topic {number}. {name} ---\n")
+            for row in zip(words, pronounce, meaning):
+                if any('\t' in field or '\n' in field for field in row):
+                    raise ValueError(f"Topic {number}: {row[0]!r} has a tab or line break, use CSV or NDJSON")
+                f.write('\t'.join(row) + '\n')
+
+
+def write_csv_topics(path, topics):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        for number, name, words, pronounce, meaning in topics:
+            f.write(f"# --- Topic {number}. {name} ---\n")
+            writer.writerows(zip(words, pronounce, meaning))
+
+
+def write_ndjson_topics(path, topics):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for number, name, words, pronounce, meaning in topics:
+            f.write(json.dumps({"topic": number, "name": name}, ensure_ascii=False) + '\n')
+            for row in zip(words, pronounce, meaning):
+                f.write(json.dumps(dict(zip(("word", "pronounce", "meaning"), row)), ensure_ascii=False) + '\n')
+
+
+# extension: (loader, writer)
+SOURCE_FORMATS = {
+    ".tsv": (iter_tsv_topics, write_tsv_topics),
+    ".csv": (iter_csv_topics, write_csv_topics),
+    ".ndjson": (iter_ndjson_topics, write_ndjson_topics),
+}
+
+
+def _source_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SOURCE_FORMATS:
+        raise ValueError(f"Unsupported topic file {path!r}, expected one of {', '.join(SOURCE_FORMATS)}")
+    return SOURCE_FORMATS[extension]
+
+
+def load_topics(path, strict=True):
+    """Lazily yield the topic blocks of a .tsv, .csv or .ndjson source file.
+
+    With strict=False malformed rows are loaded as far as they go instead
+    of raising, so validation can report them.
+    """
+    return _source_format(path)[0](path, strict)
+
+
+def save_topics(path, topics):
+    """Write topic blocks to a source file, in the format its extension names.
+
+    The file is written next to path and moved into place once complete, so
+    topics may be read lazily from path itself and a failed read leaves the
+    old file as it was.
+    """
+    write = _source_format(path)[1]
+    temp_path = path + '.tmp'
+    try:
+        write(temp_path, topics)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+
+
+_default_topics = None
+
+
+def default_topics():
+    """The TOEIC 600 topic blocks from DEFAULT_SOURCE, loaded once."""
+    global _default_topics
+    if _default_topics is None:
+        _default_topics = list(load_topics(DEFAULT_SOURCE))
+    return _default_topics
+
+
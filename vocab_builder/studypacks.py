@@ -0,0 +1,96 @@
+"""Day-by-day study packs: the deck split into small session files."""
+import hashlib
+import json
+import os
+import random
+
+from .shards import remove_stale_files
+
+# Words in a pack: about what a first study session gets through
+DEFAULT_PACK_SIZE = 20
+
+
+def _round_robin(queues):
+    """Interleave lists, one element of each per round, until all are used up."""
+    merged = []
+    active = [queue for queue in queues if queue]
+    depth = 0
+    while active:
+        for queue in active:
+            merged.append(queue[depth])
+        depth += 1
+        active = [queue for queue in active if len(queue) > depth]
+    return merged
+
+
+def plan_study_packs(items, pack_size=DEFAULT_PACK_SIZE, seed=0):
+    """Split record positions into packs of pack_size, balanced across topics and parts of speech.
+
+    Records are bucketed by category and partOfSpeech. Each bucket and the
+    order of buckets within a topic are shuffled with seed, buckets are
+    interleaved within their topic, and topics (in shuffled order) are then
+    interleaved round-robin, so consecutive words come from different
+    topics and each topic alternates parts of speech. The sequence is cut
+    into packs; only the last may be smaller. Every step is linear in the
+    deck and the plan is the same for the same deck and seed.
+    """
+    if pack_size < 1:
+        raise ValueError("pack_size must be at least 1")
+    rng = random.Random(seed)
+    topics = {}
+    for position, item in enumerate(items):
+        topics.setdefault(item.get("category", ""), {}).setdefault(item.get("partOfSpeech", ""), []).append(position)
+    topic_queues = []
+    for buckets in topics.values():
+        buckets = list(buckets.values())
+        for bucket in buckets:
+            rng.shuffle(bucket)
+        rng.shuffle(buckets)
+        topic_queues.append(_round_robin(buckets))
+    rng.shuffle(topic_queues)
+    sequence = _round_robin(topic_queues)
+    return [sequence[start:start + pack_size] for start in range(0, len(sequence), pack_size)]
+
+
+def pack_file_name(day, width=3):
+    return f"day-{day:0{width}d}.json"
+
+
+def write_study_packs(out_dir, items, pack_size=DEFAULT_PACK_SIZE, seed=0, index_name='index.json'):
+    """Write one minified JSON array per study day into out_dir, plus an index.
+
+    The index lists each day's file, word count, topics and parts of speech
+    covered, size in bytes and sha256, so the app can fetch the first pack
+    alone and cache packs by hash. Pack files left over from a previous,
+    longer plan are removed. Returns the index as a dict.
+    """
+    items = list(items)
+    packs = plan_study_packs(items, pack_size, seed)
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, index_name)
+    width = max(3, len(str(len(packs))))
+    entries = []
+    for day, positions in enumerate(packs, 1):
+        records = [items[position] for position in positions]
+        data = json.dumps(records, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        file_name = pack_file_name(day, width)
+        with open(os.path.join(out_dir, file_name), 'wb') as f:
+            f.write(data)
+        parts_of_speech = {}
+        for record in records:
+            pos = record.get("partOfSpeech", "")
+            parts_of_speech[pos] = parts_of_speech.get(pos, 0) + 1
+        entries.append({"day": day, "file": file_name, "wordCount": len(records),
+                        "topics": len({record.get("category", "") for record in records}),
+                        "partsOfSpeech": parts_of_speech, "bytes": len(data),
+                        "hash": hashlib.sha256(data).hexdigest()})
+
+    remove_stale_files(out_dir, index_path, "packs", {entry["file"] for entry in entries})
+
+    index = {"packSize": pack_size, "seed": seed,
+             "wordCount": sum(entry["wordCount"] for entry in entries),
+             "bytes": sum(entry["bytes"] for entry in entries),
+             "packs": entries}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    return index
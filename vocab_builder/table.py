@@ -0,0 +1,187 @@
+"""Column storage for vocabulary records."""
+from array import array
+
+from .pipeline import parse_pos_batch
+from .sources import default_topics
+
+
+class StringPool:
+    """Interns strings to small integer ids so equal values are stored once.
+
+    A single pool can back several tables; decks that share headwords, IPA
+    strings or meanings then keep one copy of each.
+    """
+    __slots__ = ('_ids', '_strings')
+
+    def __init__(self):
+        self._ids = {}
+        self._strings = []
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __getitem__(self, string_id):
+        return self._strings[string_id]
+
+    def intern(self, string):
+        if self._ids is None:
+            self._ids = {string: string_id for string_id, string in enumerate(self._strings)}
+        string_id = self._ids.get(string)
+        if string_id is None:
+            string_id = self._ids[string] = len(self._strings)
+            self._strings.append(string)
+        return string_id
+
+    def compact(self):
+        """Drop the lookup index once loading is done; intern() rebuilds it on demand.
+
+        The index costs a dict slot and an int object per string, which is
+        more than the pooled column itself for decks with mostly unique text.
+        """
+        self._ids = None
+
+
+# Default pool shared by every VocabularyTable in the process
+SHARED_POOL = StringPool()
+
+
+class VocabularyRow:
+    """Read-only view of one row of a VocabularyTable."""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def word(self):
+        return self._table.pool[self._table.words[self._index]]
+
+    @property
+    def pronounce(self):
+        return self._table.pool[self._table.pronounces[self._index]]
+
+    @property
+    def meaning(self):
+        return self._table.pool[self._table.meanings[self._index]]
+
+    @property
+    def topic(self):
+        return self._table.topic_names[self._table.topics[self._index]]
+
+    @property
+    def pos(self):
+        return self._table.pos_tags[self._table.pos[self._index]]
+
+    def to_record(self):
+        return {"word": self.word, "pronounce": self.pronounce, "meaning": self.meaning}
+
+
+class VocabularyTable:
+    """Column-oriented store for vocabulary rows.
+
+    word, pronounce and meaning are 'I' arrays of ids into a StringPool;
+    topic and part of speech are small 'H'/'B' arrays indexing topic_names
+    and pos_tags. Rows are materialized only on access, as VocabularyRow
+    views or as plain records from to_records().
+    """
+    __slots__ = ('pool', 'words', 'pronounces', 'meanings', 'topics', 'pos', 'topic_names', 'pos_tags', '_topic_ids', '_pos_ids')
+
+    def __init__(self, pool=SHARED_POOL):
+        self.pool = pool
+        self.words = array('I')
+        self.pronounces = array('I')
+        self.meanings = array('I')
+        self.topics = array('H')
+        self.pos = array('B')
+        self.topic_names = []
+        self.pos_tags = []
+        self._topic_ids = {}
+        self._pos_ids = {}
+
+    @classmethod
+    def from_topics(cls, topics=None, pool=SHARED_POOL):
+        """Build a table from topic blocks, keeping each word's part of speech."""
+        table = cls(pool)
+        if topics is None:
+            topics = default_topics()
+        for _number, name, words, pronounce, meaning in topics:
+            cleaned, pos, _issues = parse_pos_batch(words)
+            table.extend(zip(cleaned, pronounce, meaning, [name] * len(words), pos))
+        return table
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.words)
+        if not 0 <= index < len(self.words):
+            raise IndexError('VocabularyTable index out of range')
+        return VocabularyRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.words)):
+            yield VocabularyRow(self, index)
+
+    def _topic_id(self, name):
+        topic_id = self._topic_ids.get(name)
+        if topic_id is None:
+            topic_id = self._topic_ids[name] = len(self.topic_names)
+            self.topic_names.append(name)
+        return topic_id
+
+    def _pos_id(self, tag):
+        pos_id = self._pos_ids.get(tag)
+        if pos_id is None:
+            pos_id = self._pos_ids[tag] = len(self.pos_tags)
+            self.pos_tags.append(tag)
+        return pos_id
+
+    def append(self, word, pronounce, meaning, topic='', pos=''):
+        self.extend(((word, pronounce, meaning, topic, pos),))
+
+    def extend(self, rows):
+        """Append (word, pronounce, meaning, topic, pos) tuples in bulk."""
+        intern = self.pool.intern
+        words, pronounces, meanings, topics, pos_ids = [], [], [], [], []
+        for word, pronounce, meaning, topic, pos in rows:
+            words.append(intern(word))
+            pronounces.append(intern(pronounce))
+            meanings.append(intern(meaning))
+            topics.append(self._topic_id(topic))
+            pos_ids.append(self._pos_id(pos))
+        self.words.extend(words)
+        self.pronounces.extend(pronounces)
+        self.meanings.extend(meanings)
+        self.topics.extend(topics)
+        self.pos.extend(pos_ids)
+
+    def reintern(self, pool):
+        """Return a copy of the table whose strings live in pool.
+
+        Tables built in worker processes come back with private pools;
+        re-interning them into one pool shares the strings decks have in
+        common. Each distinct string of this table is looked up once.
+        """
+        table = type(self)(pool)
+        strings = self.pool
+        remap = {}
+        for column, target in ((self.words, table.words), (self.pronounces, table.pronounces),
+                               (self.meanings, table.meanings)):
+            for string_id in set(column).difference(remap):
+                remap[string_id] = pool.intern(strings[string_id])
+            target.extend(map(remap.__getitem__, column))
+        table.topics.extend(self.topics)
+        table.pos.extend(self.pos)
+        table.topic_names.extend(self.topic_names)
+        table.pos_tags.extend(self.pos_tags)
+        table._topic_ids.update(self._topic_ids)
+        table._pos_ids.update(self._pos_ids)
+        return table
+
+    def to_records(self):
+        """Yield rows as {"word", "pronounce", "meaning"} dicts, in insertion order."""
+        strings = self.pool
+        for word, pronounce, meaning in zip(self.words, self.pronounces, self.meanings):
+            yield {"word": strings[word], "pronounce": strings[pronounce], "meaning": strings[meaning]}
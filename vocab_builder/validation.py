@@ -0,0 +1,88 @@
+"""Structural checks for the parallel lists of topic blocks."""
+import os
+
+from .dedup import normalize_text
+from .pipeline import parse_pos_batch
+from .sources import default_topics
+
+# Problem codes and whether they break the build ("error") or only the data ("warning")
+PROBLEM_SEVERITY = {
+    "length-mismatch": "error",
+    "empty-word": "error",
+    "empty-meaning": "error",
+    "pos-tag": "warning",
+    "ipa-wrapping": "warning",
+    "placeholder": "warning",
+}
+
+# Topics handed to each worker process at a time
+VALIDATION_CHUNK_SIZE = 64
+
+
+def _problem(topic, index, field, code, message, value=None):
+    return {"topic": topic[0], "name": topic[1], "index": index, "field": field,
+            "code": code, "severity": PROBLEM_SEVERITY[code], "message": message, "value": value}
+
+
+def validate_topic(topic):
+    """Return the structural problems of one topic block as a list of dicts."""
+    _number, _name, words, pronounce, meaning = topic
+    problems = []
+    lengths = (len(words), len(pronounce), len(meaning))
+    if len(set(lengths)) > 1:
+        problems.append(_problem(topic, None, None, "length-mismatch",
+                                 "words/pronounce/meaning have {}/{}/{} entries".format(*lengths)))
+
+    cleaned, _pos, issues = parse_pos_batch(words)
+    for index, word, reason in issues:
+        problems.append(_problem(topic, index, "words", "pos-tag", reason, word))
+    for index, word in enumerate(cleaned):
+        if not word:
+            problems.append(_problem(topic, index, "words", "empty-word", "word is empty", words[index]))
+
+    for index, value in enumerate(pronounce):
+        if len(value) < 3 or value[0] != '/' or value[-1] != '/' or not value[1:-1].strip():
+            problems.append(_problem(topic, index, "pronounce", "ipa-wrapping",
+                                     "pronunciation is not wrapped in /.../", value))
+        elif index < len(cleaned) and value == cleaned[index]:
+            problems.append(_problem(topic, index, "pronounce", "placeholder",
+                                     "pronunciation repeats the word", value))
+
+    for index, value in enumerate(meaning):
+        if not value.strip():
+            problems.append(_problem(topic, index, "meaning", "empty-meaning", "meaning is empty", value))
+        elif index < len(cleaned) and normalize_text(value) == normalize_text(cleaned[index]):
+            problems.append(_problem(topic, index, "meaning", "placeholder", "meaning repeats the word", value))
+    return problems
+
+
+def validate_topics(topics=None, workers=None, parallel_threshold=2000):
+    """Validate every topic block and return one structured report.
+
+    Topics are spread across a process pool of workers (default: one per
+    CPU) in chunks once the corpus has more than parallel_threshold topics;
+    smaller corpora are checked inline, where starting the pool would cost
+    more than the checks themselves.
+    """
+    topics = list(default_topics() if topics is None else topics)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(topics) > parallel_threshold:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_topic, topics, chunksize=VALIDATION_CHUNK_SIZE))
+    else:
+        results = [validate_topic(topic) for topic in topics]
+
+    problems = [problem for result in results for problem in result]
+    counts = {}
+    for problem in problems:
+        counts[problem["code"]] = counts.get(problem["code"], 0) + 1
+    return {
+        "topics": len(topics),
+        "words": sum(len(topic[2]) for topic in topics),
+        "errors": sum(1 for problem in problems if problem["severity"] == "error"),
+        "warnings": sum(1 for problem in problems if problem["severity"] == "warning"),
+        "counts": counts,
+        "problems": problems,
+    }